@@ -5,142 +5,715 @@ Discovers functions in a codebase, allows interactive testing with custom inputs
 """
 
 import ast
-import importlib.util
+import atexit
+import codecs
+import copy
+import hashlib
 import inspect
+import mmap
 import os
+import pickle
 import sys
+import threading
 import random
 import re
 import json
-from typing import Any, Dict, List, Tuple, Callable, Union, Optional
+import marshal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from time import time_ns
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import compress
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple, Callable, Union, Optional
+
+try:
+    import orjson  # Optional: several times faster than the json module
+except ImportError:
+    orjson = None
+
+# numpy arrays and non-string dict keys returned by tested functions serialize natively
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+# (public function names, {class_name: [public method names]}) of one source file
+DefinitionNames = Tuple[List[str], Dict[str, List[str]]]
+
+# On-disk caches of the definition names extracted from each source file: a single
+# index of {abs_path: [mtime_ns, size, function_names, class_info]} read once per run,
+# backed by per-file entries for files the index does not cover
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "testfriend")
+_CACHE_VERSION = 2  # Bump whenever the extracted names change for the same source
+_INDEX_PATH = os.path.join(_CACHE_DIR, f"index-v{_CACHE_VERSION}.json")
+_AST_CACHE_DIR = os.path.join(_CACHE_DIR, "ast")
+
+# Compiled module code objects, marshalled like .pyc files; each entry starts with a
+# header of the interpreter version and the source digest it was compiled from
+_BYTECODE_CACHE_DIR = os.path.join(_CACHE_DIR, "bc")
+_BYTECODE_HEADER_PREFIX = f"{sys.implementation.cache_tag}|{_CACHE_VERSION}|".encode()
+
+# Directory names never searched for source files (hidden directories are skipped as well)
+_SKIP_DIRS = frozenset({"__pycache__", "venv", "env", ".venv", ".git", ".tox", ".mypy_cache", "node_modules", "build", "dist"})
+
+# Number of functions listed per page of the terminal menu
+_MENU_PAGE_SIZE = 50
+
+# Top-level definitions always start a line with one of these keywords
+_DEFINITION_MARKERS = (b"def", b"async", b"class")
+
+# Files larger than this are not scanned for definitions (generated or vendored code)
+MAX_SOURCE_BYTES = 1024 * 1024
+
+# Below this many files, process pool start-up costs more than it saves
+_PARALLEL_DISCOVERY_MIN_FILES = 64
+
+# Batch mode generates at most this many cases ahead of the one being verified
+_BATCH_PREFETCH = 2
+
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """Yield candidate Python files under root in os.walk order, using os.scandir to avoid extra stat calls."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip hidden directories and common non-source directories
+                        if name[0] != "." and name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif name.endswith(".py") and not name.startswith("__") and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _extract_definition_names(source: Union[str, bytes]) -> DefinitionNames:
+    """Parse source code and return public function names and {class_name: [method_names]}."""
+    function_names = []
+    class_info = {}
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return function_names, class_info
+
+    # Only module-level statements and direct class members matter; bind the node types locally.
+    # ast.parse only produces the exact node classes, so type() identity checks replace isinstance
+    function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    class_def = ast.ClassDef
+
+    for node in tree.body:
+        node_type = type(node)
+        if node_type in function_types and node.name[:1] != "_":
+            function_names.append(node.name)
+        elif node_type is class_def and node.name[:1] != "_":
+            class_info[node.name] = [class_node.name for class_node in node.body if type(class_node) in function_types and class_node.name[:1] != "_"]
+
+    return function_names, class_info
+
+
+def _may_define_names(source: Any) -> bool:
+    """Cheap byte scan: False when no line of the source starts with 'def', 'async' or 'class', so parsing can be skipped."""
+    head = source[:16]
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8) :]
+    return any(head.startswith(marker) or source.find(b"\n" + marker) != -1 for marker in _DEFINITION_MARKERS)
+
+
+def _ast_cache_path(source: Any) -> str:
+    """Build the cache file path for a source buffer from its SHA256 and the Python version."""
+    digest = hashlib.sha256(source).hexdigest()
+    return os.path.join(_AST_CACHE_DIR, digest[:2], f"{digest}.{sys.implementation.cache_tag}.v{_CACHE_VERSION}.pkl")
+
+
+def _load_definition_names(file_path: str) -> DefinitionNames:
+    """Return the definition names of a file, skipping ast.parse when the same source was parsed on an earlier run.
+
+    Entries are keyed by content, so touched, copied or reverted files still hit the cache.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MAX_SOURCE_BYTES:
+            raise ValueError(f"skipped, file is larger than {MAX_SOURCE_BYTES} bytes")
+        if size == 0:
+            return [], {}
+
+        # Map the file once: the same buffer is hashed, prefiltered and parsed
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            cache_path = _ast_cache_path(source)
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path, "rb") as cache_file:
+                        return pickle.load(cache_file)
+                except Exception:
+                    pass  # Corrupt or incompatible entry - parse again and overwrite it
+
+            if not _may_define_names(source):
+                return [], {}
+
+            names = _extract_definition_names(source[:])
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(names, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is an optimization only
+
+    return names
+
+
+def _compile_module(file_path: str) -> Any:
+    """Compile a source file to a code object, reusing the marshalled code from a previous run when the source is unchanged."""
+    with open(file_path, "rb") as f:
+        source = f.read()
+
+    header = _BYTECODE_HEADER_PREFIX + hashlib.sha256(source).hexdigest().encode() + b"\n"
+    key = hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()
+    cache_path = os.path.join(_BYTECODE_CACHE_DIR, key[:2], f"{key}.mc")
+
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if data.startswith(header):
+            return marshal.loads(data[len(header) :])
+    except Exception:
+        pass  # Missing, stale or corrupt entry - compile again and overwrite it
+
+    code = compile(source, file_path, "exec")
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header + marshal.dumps(code))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is an optimization only
+
+    return code
+
+
+def _module_name(file_path: str) -> str:
+    """Return a module name unique to a source file, so definitions from different files never share a __module__."""
+    return f"tf_{hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=8).hexdigest()}"
+
+
+def _scan_file(file_path: str) -> Tuple[Optional[DefinitionNames], Optional[Exception]]:
+    """Worker for parallel discovery: return (definition names, None) or (None, error) for a file."""
+    try:
+        return _load_definition_names(file_path), None
+    except Exception as e:
+        return None, e
+
+
+class FuncRef(NamedTuple):
+    """A discovered function or method whose module has not been imported yet."""
+
+    file_path: str
+    func_name: str
+    class_name: Optional[str] = None
+
+
+class ClassRef(NamedTuple):
+    """A discovered class whose module has not been imported yet."""
+
+    file_path: str
+    class_name: str
+
+
+class TestRecord(NamedTuple):
+    """One executed test, as tracked in FunctionTester.test_results."""
+
+    function_name: str
+    inputs: Dict[str, Any]
+    output: Any
+    success: bool
+    verification: Optional[str]  # 'PASSED', 'FAILED', or None
+    timestamp_ns: int
+
+
+# Fast paths for the common shapes of typed-in values
+_INT_RE = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLOAT_RE = re.compile(r"-?[0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?")
+_LITERALS = {"True": True, "False": False, "None": None}
+
+
+@lru_cache(maxsize=1024)
+def _parse_literal_expression(text: str) -> ast.Expression:
+    """Parse an input string as an expression, once per distinct string (the same preprocessing literal_eval applies)."""
+    return ast.parse(text.lstrip(" \t"), mode="eval")
+
+
+def _parse_input_value(text: str) -> Any:
+    """Evaluate user input as a Python literal, falling back to the raw string.
+
+    Plain ints, floats and True/False/None are converted directly; anything else
+    goes through ast.literal_eval, so results match literal_eval exactly. Only the
+    parsed tree is cached, so mutable results (lists, dicts) are never shared.
+    """
+    if text in _LITERALS:
+        return _LITERALS[text]
+
+    try:
+        if _INT_RE.fullmatch(text):
+            return int(text)
+        if _FLOAT_RE.fullmatch(text):
+            return float(text)
+        return ast.literal_eval(_parse_literal_expression(text))
+    except (ValueError, SyntaxError):
+        return text
+
+
+# Parameter-name and docstring heuristics for rule-based input generation; each keyword
+# group is one alternation so a single scan of the name replaces a loop of substring tests
+_NUMBER_KW_RE = re.compile(r"num|count|size|length|width|height|age|year|weight|mass|distance|speed|price|cost|amount|quantity|volume|area|radius|diameter|score|rating")
+_STRING_KW_RE = re.compile(r"name|text|string|message|word|title|description|address|city|country|subject|content|label")
+_BOOL_KW_RE = re.compile(r"is_|has_|can_|should_|flag|enabled|active|valid")
+_LIST_KW_RE = re.compile(r"list|array|items|numbers|values|data")
+_DIMENSION_KW_RE = re.compile(r"length|width|distance|radius")
+_MONEY_KW_RE = re.compile(r"price|cost|amount")
+_RATING_KW_RE = re.compile(r"score|rating")
+_RECIPIENT_KW_RE = re.compile(r"to|recipient|sender")
+_FACT_RE = re.compile(r"factorial|fact")
+_BMI_RE = re.compile(r"bmi|body.*mass")
+_DIGIT_RE = re.compile(r"\d")
+
+# Generators for parameter names that are matched exactly (coordinates and math variables);
+# none of these names contain a keyword above, so they are resolved before the keyword ladder
+_EXACT_PARAM_GENERATORS = {
+    "lat": lambda: round(random.uniform(-90, 90), 6),
+    "latitude": lambda: round(random.uniform(-90, 90), 6),
+    "lon": lambda: round(random.uniform(-180, 180), 6),
+    "longitude": lambda: round(random.uniform(-180, 180), 6),
+    **dict.fromkeys(("x", "y", "z"), lambda: random.randint(0, 100)),
+    **dict.fromkeys(("a", "b", "c", "n", "m", "k"), lambda: random.randint(1, 10)),
+}
+
+
+def _dumps_json(obj, default=None, sort_keys: bool = False) -> bytes:
+    """Serialize obj to JSON bytes with orjson when installed, else the json module.
+
+    default is called for values with no JSON form, as in json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS)
+        except TypeError:
+            if default is None:
+                raise
+            # Values orjson rejects without consulting default (e.g. ints beyond 64 bits)
+    return json.dumps(obj, default=default, sort_keys=sort_keys).encode()
+
+
+def _verification_key(func_name: str, inputs: Dict[str, Any]) -> Optional[Tuple[str, bytes]]:
+    """Key a test result by function name and its inputs as sent to the browser, or None if inputs cannot be encoded.
+
+    The inputs are encoded like web responses (_dumps_json, non-JSON values as str()) with sorted
+    keys, so inputs echoed back by the browser encode to the same text as the stored originals.
+    """
+    try:
+        return func_name, _dumps_json(inputs, default=str, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def _typed_value_key(value: Any) -> Tuple:
+    """Pair a value with its type (recursively for tuples and frozensets) so 1, True and 1.0 key differently."""
+    if type(value) is tuple:
+        return tuple, tuple(_typed_value_key(item) for item in value)
+    if type(value) is frozenset:
+        return frozenset, frozenset(_typed_value_key(item) for item in value)
+    return type(value), value
+
+
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Return inspect.signature(func), computed once per callable."""
+    sig = getattr(func, "__signature__", None)
+    if isinstance(sig, inspect.Signature):
+        return sig
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=256)
+def _format_second(second: int) -> str:
+    """Format a Unix time in whole seconds as local time; results recorded in the same second share one string."""
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=4096)
+def _value_factory_for_parameter(param_name: str, docstring: str) -> Callable[[], Any]:
+    """Pick the rule-based generator for a parameter from its name and the function docstring.
+
+    Matching is the expensive part and depends only on the two strings, so it is cached;
+    the returned callable still draws fresh random values on every call.
+    """
+    param_lower = param_name.lower()
+
+    generator = _EXACT_PARAM_GENERATORS.get(param_lower)
+    if generator is not None:
+        return generator
+
+    # Enhanced number-related parameters
+    if _NUMBER_KW_RE.search(param_lower):
+        if "age" in param_lower:
+            return lambda: random.randint(18, 80)
+        elif "year" in param_lower:
+            return lambda: random.randint(1990, 2024)
+        elif "weight" in param_lower or "mass" in param_lower:
+            return lambda: round(random.uniform(50.0, 120.0), 1)  # kg
+        elif "height" in param_lower:
+            return lambda: round(random.uniform(1.5, 2.1), 2)  # meters
+        elif _DIMENSION_KW_RE.search(param_lower):
+            return lambda: round(random.uniform(1.0, 100.0), 1)
+        elif _MONEY_KW_RE.search(param_lower):
+            return lambda: round(random.uniform(10.0, 1000.0), 2)
+        elif _RATING_KW_RE.search(param_lower):
+            return lambda: random.randint(1, 10)
+        elif "percentage" in param_lower or "percent" in param_lower:
+            return lambda: random.randint(0, 100)
+        else:
+            return lambda: random.randint(1, 100)
+
+    # Enhanced string-related parameters
+    if _STRING_KW_RE.search(param_lower):
+        if "name" in param_lower:
+            if "first" in param_lower:
+                return lambda: random.choice(["Alice", "Bob", "Charlie", "Diana", "Eve"])
+            elif "last" in param_lower:
+                return lambda: random.choice(["Smith", "Johnson", "Williams", "Brown", "Jones"])
+            else:
+                return lambda: random.choice(["Alice Smith", "Bob Johnson", "Charlie Brown"])
+        elif "email" in param_lower:
+            return lambda: "test@example.com"
+        elif "address" in param_lower:
+            return lambda: "123 Main St, Anytown, USA"
+        elif "city" in param_lower:
+            return lambda: random.choice(["New York", "London", "Tokyo", "Paris", "Sydney"])
+        elif "country" in param_lower:
+            return lambda: random.choice(["USA", "UK", "Japan", "France", "Australia"])
+        elif "subject" in param_lower or "title" in param_lower:
+            return lambda: random.choice(["Important Update", "Meeting Reminder", "Project Status"])
+        elif "message" in param_lower or "content" in param_lower:
+            return lambda: random.choice(["Hello World", "This is a test message", "Sample content"])
+        else:
+            return lambda: "sample_text"
+
+    # Boolean parameters
+    if _BOOL_KW_RE.search(param_lower):
+        return lambda: random.choice([True, False])
+
+    # List/array parameters
+    if _LIST_KW_RE.search(param_lower):
+        if "numbers" in param_lower or "values" in param_lower:
+            return lambda: [random.randint(1, 10) for _ in range(random.randint(2, 5))]
+        else:
+            return lambda: [f"item{i}" for i in range(1, random.randint(3, 6))]
+
+    # Temperature parameters
+    if "temp" in param_lower:
+        if "celsius" in param_lower:
+            return lambda: random.randint(-10, 40)
+        elif "fahrenheit" in param_lower:
+            return lambda: random.randint(14, 104)
+        else:
+            return lambda: random.randint(20, 30)
+
+    # Analyze docstring for additional context
+    if docstring:
+        doc_lower = docstring.lower()
+        if _FACT_RE.search(doc_lower) and param_lower == "n":
+            return lambda: random.randint(1, 8)  # Keep factorial small
+        if _BMI_RE.search(doc_lower):
+            if "weight" in param_lower:
+                return lambda: round(random.uniform(50.0, 120.0), 1)
+            elif "height" in param_lower:
+                return lambda: round(random.uniform(1.5, 2.1), 2)
+        if "email" in doc_lower and _RECIPIENT_KW_RE.search(param_lower):
+            return lambda: "user@example.com"
+
+    # Default fallbacks
+    if len(param_name) == 1:  # Single letter parameters
+        return lambda: random.randint(1, 10)
+
+    # Check if it might be a numeric parameter based on context
+    if _DIGIT_RE.search(param_name):  # Contains digits
+        return lambda: random.randint(1, 100)
+
+    # Default string for unknown parameters
+    return lambda: f"test_{param_name}"
 
 
 class FunctionTester:
-    def __init__(self, target_directory: str = ".", api_key: Optional[str] = None):
+    def __init__(self, target_directory: str = ".", api_key: Optional[str] = None, cache_results: bool = False):
         self.target_directory = target_directory
         self.discovered_functions = {}
         self.discovered_classes = {}  # Store discovered classes
+        self._module_cache = {}  # {file_path: (mtime_ns, size, module namespace or None)}, filled on first use
+        self._available_classes = None  # Resolved copy of discovered_classes, built on first use
+        self._class_match_table = None  # [(lowercase class name, class name, class)], built on first use
+        self._class_match_re = None  # Alternation of the lowercase class names (None when there are no classes)
+        self._class_match_cache = {}  # {parameter name: (class name, class) or None}
+        self._index = None  # Discovery index loaded from _INDEX_PATH, saved at exit
+        self._index_dirty = False
         self.api_key = api_key
         self.llm_available = api_key is not None
-        self.test_results = []  # Track all test results
-
-    def discover_functions(self) -> Dict[str, Callable]:
-        """Discover all functions and classes in Python files within the target directory."""
+        self._lock = threading.RLock()  # Guards lazy resolution and result tracking (web handler threads, batch generation)
+        self.test_results = []  # Track all test results (TestRecord)
+        self.results_version = 0  # Bumped whenever a result is added or verified, so unchanged summaries can be detected
+        self._test_success = []  # Column of test_results[i].success (TestRecord field), for C-level counting
+        self._test_verification = []  # Column of test_results[i].verification (TestRecord field), kept in step with it
+        self._pending_verification = {}  # {_verification_key(function name, inputs): [indices of unverified results]}
+        self.cache_results = cache_results  # Reuse outputs of repeated calls (pure functions only)
+        self._result_cache = {}  # {(callable, typed frozen inputs): private copy of the result}
+        self._message_buffer = threading.local()  # .messages collects generation output on batch worker threads
+
+    def discover_functions(self) -> Dict[str, Union[Callable, Dict, FuncRef]]:
+        """Discover all functions and classes in Python files within the target directory.
+
+        Only the source is parsed here; modules are imported lazily by get_function()
+        and discover_available_classes().
+        """
+        for _ in self.iter_discover():
+            pass
+        return self.discovered_functions
+
+    def iter_discover(self) -> Iterator[Tuple[str, FuncRef]]:
+        """Discover functions incrementally, yielding (key, reference) pairs file by file.
+
+        discovered_functions and discovered_classes are replaced once the walk completes.
+        """
         functions = {}
         classes = {}
 
-        for root, dirs, files in os.walk(self.target_directory):
-            # Skip hidden directories and common non-source directories
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d not in ["__pycache__", "venv", "env"]]
+        file_paths = list(_iter_py_files(self.target_directory))
 
-            for file in files:
-                if file.endswith(".py") and not file.startswith("__"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_functions, file_classes = self._extract_functions_and_classes_from_file(file_path)
-                        functions.update(file_functions)
-                        classes.update(file_classes)
-                    except Exception as e:
-                        print(f"Warning: Could not process {file_path}: {e}")
+        for file_path, (names, error) in zip(file_paths, self._lookup_definition_names(file_paths)):
+            try:
+                if error is not None:
+                    raise error
+                file_functions, file_classes = self._collect_definition_refs(file_path, *names)
+            except Exception as e:
+                print(f"Warning: Could not process {file_path}: {e}")
+                continue
+
+            functions.update(file_functions)
+            classes.update(file_classes)
+            yield from file_functions.items()
 
         self.discovered_functions = functions
         self.discovered_classes = classes
-        return functions
+        self._available_classes = None
+        self._class_match_table = None
+        self._class_match_cache = {}
 
-    def _extract_functions_and_classes_from_file(self, file_path: str) -> Tuple[Dict[str, Callable], Dict[str, type]]:
-        """Extract functions, classes, and class methods from a single Python file."""
-        functions = {}
-        classes = {}
+    def _load_index(self) -> Dict[str, list]:
+        """Load the discovery index once per tester and arrange for it to be saved at exit."""
+        if self._index is None:
+            try:
+                with open(_INDEX_PATH, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            atexit.register(self._save_index)
+        return self._index
+
+    def _save_index(self):
+        """Write the discovery index back to disk if it changed."""
+        if not self._index_dirty:
+            return
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{_INDEX_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, _INDEX_PATH)
+            self._index_dirty = False
+        except OSError:
+            pass  # The index is an optimization only
+
+    def _lookup_definition_names(self, file_paths: List[str]) -> Iterator[Tuple[Optional[DefinitionNames], Optional[Exception]]]:
+        """Yield definition names for each file in order, scanning only files whose mtime or size changed since the index was written."""
+        index = self._load_index()
+        entries = []  # [(abs_path, stat, indexed names or None)]
+        misses = []
+
+        for file_path in file_paths:
+            abs_path = os.path.abspath(file_path)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
 
-        # Parse the file to get function and class names with their methods
-        with open(file_path, "r", encoding="utf-8") as f:
+            entry = index.get(abs_path)
+            if st is not None and entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                entries.append((abs_path, st, (entry[2], entry[3])))
+            else:
+                entries.append((abs_path, st, None))
+                misses.append(file_path)
+
+        # Results of changed files stream in (in order) while earlier files are consumed
+        scanned = self._scan_files(misses)
+        for abs_path, st, names in entries:
+            if names is not None:
+                yield names, None
+                continue
+
+            names, error = next(scanned)
+            if error is None and st is not None:
+                index[abs_path] = [st.st_mtime_ns, st.st_size, names[0], names[1]]
+                self._index_dirty = True
+            yield names, error
+
+        # Drop entries for files under the target directory that no longer exist
+        root_prefix = os.path.join(os.path.abspath(self.target_directory), "")
+        seen = {abs_path for abs_path, _, _ in entries}
+        for abs_path in [path for path in index if path.startswith(root_prefix) and path not in seen]:
+            del index[abs_path]
+            self._index_dirty = True
+
+    def _scan_files(self, file_paths: List[str]) -> Iterator[Tuple[Optional[DefinitionNames], Optional[Exception]]]:
+        """Extract definition names for all files in order, in parallel across processes for large trees.
+
+        Smaller trees use a thread pool instead: file reads, stats and cache probes release
+        the GIL, so they overlap with parsing on the other threads.
+        """
+        done = 0
+        if len(file_paths) >= _PARALLEL_DISCOVERY_MIN_FILES:
             try:
-                tree = ast.parse(f.read())
-            except SyntaxError:
-                return functions, classes
+                # Batch files to amortize IPC, but keep at least ~4 batches per worker so
+                # uneven files still balance across the pool
+                workers = os.cpu_count() or 1
+                chunksize = max(1, min(16, len(file_paths) // (workers * 4)))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for result in executor.map(_scan_file, file_paths, chunksize=chunksize):
+                        yield result
+                        done += 1
+                return
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                pass  # Multiprocessing unavailable - scan the remaining files with threads
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            yield from executor.map(_scan_file, file_paths[done:])
+
+    def _collect_definition_refs(self, file_path: str, function_names: List[str], class_info: Dict[str, List[str]]) -> Tuple[Dict[str, FuncRef], Dict[str, ClassRef]]:
+        """Build unresolved references for the functions, classes, and class methods named in a file."""
+        functions = {}
+        classes = {}
+        rel_path = os.path.relpath(file_path)  # Computed once per file, not per definition
 
-        # Get function, class, and method definitions
-        function_names = []
-        class_info = {}  # {class_name: [method_names]}
+        # Keys are interned: they are hashed repeatedly as dict keys and menu entries
+        for func_name in function_names:
+            key = sys.intern(f"{rel_path}::{func_name}")
+            functions[key] = FuncRef(file_path, func_name)
 
-        for node in tree.body:
-            if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
-                function_names.append(node.name)
-            elif isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
-                class_name = node.name
-                method_names = []
+        for class_name, method_names in class_info.items():
+            classes[class_name] = ClassRef(file_path, class_name)
 
-                for class_node in node.body:
-                    if isinstance(class_node, ast.FunctionDef) and not class_node.name.startswith("_"):
-                        method_names.append(class_node.name)
+            for method_name in method_names:
+                key = sys.intern(f"{rel_path}::{class_name}.{method_name}")
+                functions[key] = FuncRef(file_path, method_name, class_name)
 
-                class_info[class_name] = method_names
+        return functions, classes
 
-        if not function_names and not class_info:
-            return functions, classes
+    def _load_module(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Execute a file into a fresh namespace dict, once until the file changes. Returns None on failure.
 
-        # Import the module to get actual function and class objects
+        compile() + exec() avoids the importlib finder/loader machinery; only the
+        callables in the resulting namespace are needed. The code object itself comes
+        from the bytecode cache when the file has not changed.
+        """
         try:
-            spec = importlib.util.spec_from_file_location("temp_module", file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Extract standalone functions
-            for func_name in function_names:
-                if hasattr(module, func_name):
-                    func = getattr(module, func_name)
-                    if callable(func):
-                        key = f"{os.path.relpath(file_path)}::{func_name}"
-                        functions[key] = func
-
-            # Extract classes and their methods
-            for class_name, method_names in class_info.items():
-                if hasattr(module, class_name):
-                    cls = getattr(module, class_name)
-                    if inspect.isclass(cls):
-                        classes[class_name] = cls
-
-                        # Extract methods from the class
-                        for method_name in method_names:
-                            if hasattr(cls, method_name):
-                                method = getattr(cls, method_name)
-                                if callable(method):
-                                    # Determine method type
-                                    if isinstance(inspect.getattr_static(cls, method_name), staticmethod):
-                                        method_type = "static"
-                                    elif isinstance(inspect.getattr_static(cls, method_name), classmethod):
-                                        method_type = "class"
-                                    else:
-                                        method_type = "instance"
+            st = os.stat(file_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
 
-                                    key = f"{os.path.relpath(file_path)}::{class_name}.{method_name}"
-                                    functions[key] = {"method": method, "class": cls, "type": method_type, "name": method_name}
+        # Rediscovery keeps namespaces of unchanged files instead of re-running their top-level code
+        cached = self._module_cache.get(file_path)
+        if cached is not None and stamp is not None and cached[:2] == stamp:
+            return cached[2]
 
+        namespace = None
+        try:
+            code = _compile_module(file_path)
+            namespace = {"__name__": _module_name(file_path), "__file__": file_path}
+            exec(code, namespace)
         except Exception as e:
             print(f"Warning: Could not import from {file_path}: {e}")
+            namespace = None
 
-        return functions, classes
+        if stamp is not None:
+            self._module_cache[file_path] = (*stamp, namespace)
+        return namespace
+
+    def _resolve_function(self, ref: FuncRef) -> Optional[Union[Callable, Dict]]:
+        """Import the module behind a reference and return the callable or method info dict."""
+        namespace = self._load_module(ref.file_path)
+        if namespace is None:
+            return None
+
+        # Standalone function
+        if ref.class_name is None:
+            func = namespace.get(ref.func_name)
+            return func if callable(func) else None
+
+        # Class method
+        cls = namespace.get(ref.class_name)
+        if not inspect.isclass(cls) or not hasattr(cls, ref.func_name):
+            return None
+
+        method = getattr(cls, ref.func_name)
+        if not callable(method):
+            return None
+
+        # Determine method type from the raw class attribute, looked up once; methods defined
+        # on the class itself (the common case) are read from its __dict__ without an MRO walk
+        raw_attr = cls.__dict__[ref.func_name] if ref.func_name in cls.__dict__ else inspect.getattr_static(cls, ref.func_name)
+        if isinstance(raw_attr, staticmethod):
+            method_type = "static"
+        elif isinstance(raw_attr, classmethod):
+            method_type = "class"
+        else:
+            method_type = "instance"
+
+        method_info = {"method": method, "class": cls, "type": method_type, "name": ref.func_name}
+        if method_type == "instance":
+            # Decided once here rather than on every run_test call
+            method_info["default_constructible"] = self._has_default_constructor(cls)
+        return method_info
+
+    def get_function(self, func_key: str) -> Optional[Union[Callable, Dict]]:
+        """Get a discovered function or method info dict by key, importing its module on first use."""
+        func = self.discovered_functions.get(func_key)
+        if isinstance(func, FuncRef):
+            with self._lock:
+                func = self.discovered_functions.get(func_key)  # May have been resolved while waiting
+                if isinstance(func, FuncRef):
+                    func = self._resolve_function(func)
+                    if func is None:
+                        print(f"Warning: Could not load {func_key}")
+                        return None
+                    self.discovered_functions[func_key] = func
+        return func
 
     def get_function_signature(self, func: Union[Callable, Dict]) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
         """Get function parameters and their default values."""
-        # Handle class methods
+        # Handle class methods ('self'/'cls' are skipped below)
         if isinstance(func, dict) and "method" in func:
-            method_info = func
-            method = method_info["method"]
-            method_type = method_info["type"]
-
-            if method_type == "static":
-                # Static method - use method signature as-is
-                sig = inspect.signature(method)
-            elif method_type == "class":
-                # Class method - use method signature as-is (cls parameter handled automatically)
-                sig = inspect.signature(method)
-            else:
-                # Instance method - we'll handle 'self' parameter specially
-                sig = inspect.signature(method)
+            sig = _cached_signature(func["method"])
         else:
             # Regular function
-            sig = inspect.signature(func)
+            sig = _cached_signature(func)
 
         params = []
         defaults = {}
@@ -160,13 +733,74 @@ class FunctionTester:
         return params, defaults, annotations
 
     def discover_available_classes(self) -> Dict[str, type]:
-        """Get the discovered classes."""
-        return self.discovered_classes.copy()
+        """Get the discovered classes, importing the modules that define them on first use.
+
+        The resolved dict is shared until the next discovery and must not be modified.
+        """
+        available_classes = self._available_classes
+        if available_classes is not None:
+            return available_classes
+
+        with self._lock:
+            for class_name, cls in list(self.discovered_classes.items()):
+                if isinstance(cls, ClassRef):
+                    namespace = self._load_module(cls.file_path)
+                    resolved = namespace.get(cls.class_name) if namespace is not None else None
+                    if inspect.isclass(resolved):
+                        self.discovered_classes[class_name] = resolved
+                    else:
+                        del self.discovered_classes[class_name]
+
+            self._available_classes = self.discovered_classes.copy()
+            return self._available_classes
+
+    def match_class_for_parameter(self, param_name: str) -> Optional[Tuple[str, type]]:
+        """Guess the class a parameter expects from its name, returning (class_name, class) or None.
+
+        A class matches when the parameter name (with or without underscores) ends with
+        or contains its lowercased name; the first match in discovery order wins.
+        """
+        if param_name in self._class_match_cache:
+            return self._class_match_cache[param_name]
+
+        if self._class_match_table is None:
+            # The discovered classes are stable for the session - lowercase their names once
+            table = [(class_name.lower(), class_name, cls) for class_name, cls in self.discover_available_classes().items()]
+            self._class_match_re = re.compile("|".join(re.escape(class_lower) for class_lower, _, _ in table)) if table else None
+            self._class_match_table = table
+
+        param_lower = param_name.lower()
+        param_stripped = param_lower.replace("_", "")
+        match = None
+        # Every match contains a class name, so one regex scan rules out most parameters;
+        # candidates still walk the table so the first class in discovery order wins
+        pattern = self._class_match_re
+        if pattern is not None and (pattern.search(param_lower) or pattern.search(param_stripped)):
+            for class_lower, class_name, cls in self._class_match_table:
+                if param_lower.endswith(class_lower) or param_stripped.endswith(class_lower) or class_lower in param_lower:
+                    match = (class_name, cls)
+                    break
+
+        self._class_match_cache[param_name] = match
+        return match
+
+    def _has_default_constructor(self, cls: type) -> bool:
+        """Check whether cls() can be called without arguments: every constructor parameter has a default or is *args/**kwargs."""
+        try:
+            sig = _cached_signature(cls)
+        except (ValueError, TypeError):
+            return True  # Signature unavailable (some builtins) - let cls() decide
+
+        optional_kinds = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        return all(param.default is not inspect.Parameter.empty or param.kind in optional_kinds for param in sig.parameters.values())
 
     def get_class_constructor_info(self, cls: type) -> Tuple[List[str], Dict[str, Any]]:
         """Get class constructor parameters and defaults."""
+        if cls.__init__ is object.__init__:  # No constructor of its own anywhere in the MRO
+            return [], {}
+
         try:
-            sig = inspect.signature(cls.__init__)
+            sig = _cached_signature(cls.__init__)
             params = []
             defaults = {}
 
@@ -204,11 +838,8 @@ class FunctionTester:
                     inputs[param] = self._generate_class_instance(annotation, available_classes)
                 else:
                     # Check if parameter name suggests a class (heuristic)
-                    potential_class = None
-                    for class_name, class_type in available_classes.items():
-                        if param.lower().endswith(class_name.lower()) or param.lower().replace("_", "").endswith(class_name.lower()) or class_name.lower() in param.lower():
-                            potential_class = class_type
-                            break
+                    match = self.match_class_for_parameter(param)
+                    potential_class = match[1] if match else None
 
                     if potential_class:
                         inputs[param] = self._generate_class_instance(potential_class, available_classes)
@@ -267,7 +898,7 @@ class FunctionTester:
                     return json.loads(json_match.group())
 
         except Exception as e:
-            print(f"LLM analysis failed: {e}")
+            self._report(f"LLM analysis failed: {e}")
 
         return None
 
@@ -277,118 +908,10 @@ class FunctionTester:
         if self.llm_available:
             llm_result = self._call_llm_for_parameter_analysis(param_name, func.__name__, docstring)
             if llm_result and "test_value" in llm_result:
-                print(f"  LLM suggestion for '{param_name}': {llm_result['test_value']} ({llm_result.get('reasoning', 'No reasoning')})")
+                self._report(f"  LLM suggestion for '{param_name}': {llm_result['test_value']} ({llm_result.get('reasoning', 'No reasoning')})")
                 return llm_result["test_value"]
 
-        param_lower = param_name.lower()
-
-        # Enhanced number-related parameters
-        number_keywords = ["num", "count", "size", "length", "width", "height", "age", "year", "weight", "mass", "distance", "speed", "price", "cost", "amount", "quantity", "volume", "area", "radius", "diameter", "score", "rating"]
-
-        if any(word in param_lower for word in number_keywords):
-            if "age" in param_lower:
-                return random.randint(18, 80)
-            elif "year" in param_lower:
-                return random.randint(1990, 2024)
-            elif "weight" in param_lower or "mass" in param_lower:
-                return round(random.uniform(50.0, 120.0), 1)  # kg
-            elif "height" in param_lower:
-                return round(random.uniform(1.5, 2.1), 2)  # meters
-            elif any(word in param_lower for word in ["length", "width", "distance", "radius"]):
-                return round(random.uniform(1.0, 100.0), 1)
-            elif any(word in param_lower for word in ["price", "cost", "amount"]):
-                return round(random.uniform(10.0, 1000.0), 2)
-            elif any(word in param_lower for word in ["score", "rating"]):
-                return random.randint(1, 10)
-            elif "percentage" in param_lower or "percent" in param_lower:
-                return random.randint(0, 100)
-            else:
-                return random.randint(1, 100)
-
-        # Enhanced string-related parameters
-        string_keywords = ["name", "text", "string", "message", "word", "title", "description", "address", "city", "country", "subject", "content", "label"]
-
-        if any(word in param_lower for word in string_keywords):
-            if "name" in param_lower:
-                if "first" in param_lower:
-                    return random.choice(["Alice", "Bob", "Charlie", "Diana", "Eve"])
-                elif "last" in param_lower:
-                    return random.choice(["Smith", "Johnson", "Williams", "Brown", "Jones"])
-                else:
-                    return random.choice(["Alice Smith", "Bob Johnson", "Charlie Brown"])
-            elif "email" in param_lower:
-                return "test@example.com"
-            elif "address" in param_lower:
-                return "123 Main St, Anytown, USA"
-            elif "city" in param_lower:
-                return random.choice(["New York", "London", "Tokyo", "Paris", "Sydney"])
-            elif "country" in param_lower:
-                return random.choice(["USA", "UK", "Japan", "France", "Australia"])
-            elif "subject" in param_lower or "title" in param_lower:
-                return random.choice(["Important Update", "Meeting Reminder", "Project Status"])
-            elif "message" in param_lower or "content" in param_lower:
-                return random.choice(["Hello World", "This is a test message", "Sample content"])
-            else:
-                return "sample_text"
-
-        # Boolean parameters
-        bool_keywords = ["is_", "has_", "can_", "should_", "flag", "enabled", "active", "valid"]
-        if any(word in param_lower for word in bool_keywords):
-            return random.choice([True, False])
-
-        # List/array parameters
-        list_keywords = ["list", "array", "items", "numbers", "values", "data"]
-        if any(word in param_lower for word in list_keywords):
-            if "numbers" in param_lower or "values" in param_lower:
-                return [random.randint(1, 10) for _ in range(random.randint(2, 5))]
-            else:
-                return [f"item{i}" for i in range(1, random.randint(3, 6))]
-
-        # Temperature parameters
-        if "temp" in param_lower:
-            if "celsius" in param_lower:
-                return random.randint(-10, 40)
-            elif "fahrenheit" in param_lower:
-                return random.randint(14, 104)
-            else:
-                return random.randint(20, 30)
-
-        # Coordinate parameters
-        if param_lower in ["x", "y", "z", "lat", "lon", "latitude", "longitude"]:
-            if param_lower in ["lat", "latitude"]:
-                return round(random.uniform(-90, 90), 6)
-            elif param_lower in ["lon", "longitude"]:
-                return round(random.uniform(-180, 180), 6)
-            else:
-                return random.randint(0, 100)
-
-        # Mathematical parameters
-        if param_lower in ["a", "b", "c", "n", "m", "k"]:
-            return random.randint(1, 10)
-
-        # Analyze docstring for additional context
-        if docstring:
-            doc_lower = docstring.lower()
-            if re.search(r"factorial|fact", doc_lower) and param_lower == "n":
-                return random.randint(1, 8)  # Keep factorial small
-            if re.search(r"bmi|body.*mass", doc_lower):
-                if "weight" in param_lower:
-                    return round(random.uniform(50.0, 120.0), 1)
-                elif "height" in param_lower:
-                    return round(random.uniform(1.5, 2.1), 2)
-            if re.search(r"email", doc_lower) and any(word in param_lower for word in ["to", "recipient", "sender"]):
-                return "user@example.com"
-
-        # Default fallbacks
-        if len(param_name) == 1:  # Single letter parameters
-            return random.randint(1, 10)
-
-        # Check if it might be a numeric parameter based on context
-        if re.search(r"\d", param_name):  # Contains digits
-            return random.randint(1, 100)
-
-        # Default string for unknown parameters
-        return f"test_{param_name}"
+        return _value_factory_for_parameter(param_name, docstring or "")()
 
     def prompt_for_inputs(self, func: Callable, auto_generate: bool = False) -> Dict[str, Any]:
         """Interactively prompt user for function inputs or auto-generate them."""
@@ -449,11 +972,8 @@ class FunctionTester:
                     continue
 
             # Check if parameter name suggests a class (heuristic)
-            potential_class = None
-            for class_name, class_type in available_classes.items():
-                if param.lower().endswith(class_name.lower()) or param.lower().replace("_", "").endswith(class_name.lower()) or class_name.lower() in param.lower():
-                    potential_class = class_type
-                    break
+            match = self.match_class_for_parameter(param)
+            potential_class = match[1] if match else None
 
             if potential_class:
                 print(f"\nParameter '{param}' might expect a {potential_class.__name__} instance.")
@@ -476,11 +996,8 @@ class FunctionTester:
             elif not user_input:
                 inputs[param] = suggested_val
             else:
-                # Try to evaluate as Python literal, fallback to string
-                try:
-                    inputs[param] = ast.literal_eval(user_input)
-                except (ValueError, SyntaxError):
-                    inputs[param] = user_input
+                # Evaluate as Python literal, fallback to string
+                inputs[param] = _parse_input_value(user_input)
 
         return inputs
 
@@ -497,7 +1014,7 @@ class FunctionTester:
             # Check if this parameter also expects a class
             param_annotation = None
             try:
-                sig = inspect.signature(cls.__init__)
+                sig = _cached_signature(cls.__init__)
                 for p_name, p_param in sig.parameters.items():
                     if p_name == param and p_param.annotation != inspect.Parameter.empty:
                         param_annotation = p_param.annotation
@@ -528,11 +1045,8 @@ class FunctionTester:
             elif not user_input:
                 constructor_inputs[param] = suggested_val
             else:
-                # Try to evaluate as Python literal, fallback to string
-                try:
-                    constructor_inputs[param] = ast.literal_eval(user_input)
-                except (ValueError, SyntaxError):
-                    constructor_inputs[param] = user_input
+                # Evaluate as Python literal, fallback to string
+                constructor_inputs[param] = _parse_input_value(user_input)
 
         try:
             instance = cls(**constructor_inputs)
@@ -555,7 +1069,7 @@ class FunctionTester:
                 # Check if this parameter also expects a class
                 param_annotation = None
                 try:
-                    sig = inspect.signature(cls.__init__)
+                    sig = _cached_signature(cls.__init__)
                     for p_name, p_param in sig.parameters.items():
                         if p_name == param and p_param.annotation != inspect.Parameter.empty:
                             param_annotation = p_param.annotation
@@ -573,13 +1087,84 @@ class FunctionTester:
             instance = cls(**constructor_inputs)
             return instance
         except Exception as e:
-            print(f"Warning: Could not create {cls.__name__} instance: {e}")
+            self._report(f"Warning: Could not create {cls.__name__} instance: {e}")
             return None
 
+    def _report(self, message: str):
+        """Print a message from input generation, or collect it when generating on a batch worker thread."""
+        messages = getattr(self._message_buffer, "messages", None)
+        if messages is None:
+            print(message)
+        else:
+            messages.append(message)
+
+    def _generate_inputs_quietly(self, func: Union[Callable, Dict]) -> Tuple[Dict[str, Any], List[str]]:
+        """Generate inputs on a worker thread, returning them with the messages that would have been printed."""
+        self._message_buffer.messages = messages = []
+        try:
+            return self.generate_intelligent_inputs(func), messages
+        finally:
+            self._message_buffer.messages = None
+
     def add_test_result(self, func_name: str, inputs: Dict[str, Any], result: Any, success: bool, verification: Optional[str] = None):
-        """Add a test result to the tracking list."""
-        test_record = {"function_name": func_name, "inputs": inputs.copy(), "output": result, "success": success, "verification": verification, "timestamp": __import__("datetime").datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  # 'PASSED', 'FAILED', or None
-        self.test_results.append(test_record)
+        """Add a test result to the tracking list.
+
+        inputs is stored by reference, not copied: every caller builds a fresh dict per test
+        and does not modify it after reporting the result.
+        """
+        with self._lock:
+            if verification is None:
+                key = _verification_key(func_name, inputs)
+                if key is not None:
+                    self._pending_verification.setdefault(key, []).append(len(self.test_results))
+
+            self.test_results.append(TestRecord(func_name, inputs, result, success, verification, time_ns()))
+            self._test_success.append(success)
+            self._test_verification.append(verification)
+            self.results_version += 1
+
+    @staticmethod
+    def format_timestamp(timestamp_ns: int) -> str:
+        """Format a test record's timestamp_ns for display (formatting is deferred until a summary is shown)."""
+        return _format_second(timestamp_ns // 1_000_000_000)
+
+    def record_verification(self, func_name: str, inputs: Dict[str, Any], passed: bool) -> bool:
+        """Mark the most recent unverified result of a call as PASSED or FAILED. Returns False if none matches.
+
+        Results are found through an index of unverified results keyed by the canonical JSON
+        of their inputs, so values that were sent to the browser as str() still match.
+        """
+        key = _verification_key(func_name, inputs)
+        with self._lock:
+            pending = self._pending_verification.get(key)
+            if not pending:
+                return False
+
+            i = pending.pop()
+            if not pending:
+                del self._pending_verification[key]
+
+            verification = self._test_verification[i] = "PASSED" if passed else "FAILED"
+            self.test_results[i] = self.test_results[i]._replace(verification=verification)
+            self.results_version += 1
+            return True
+
+    def get_test_counts(self) -> Dict[str, int]:
+        """Count tests by outcome using the columnar copies of the success and verification fields."""
+        with self._lock:
+            verification = self._test_verification
+            return {
+                "total_tests": len(self._test_success),
+                "successful_executions": sum(self._test_success),
+                "verified_passed": verification.count("PASSED"),
+                "verified_failed": verification.count("FAILED"),
+                "unverified": list(compress(verification, self._test_success)).count(None),
+            }
+
+    def snapshot_test_results(self, start: int = 0, stop: Optional[int] = None) -> Tuple[Dict[str, int], List[TestRecord]]:
+        """Return consistent copies of the outcome counts and the test records test_results[start:stop]."""
+        with self._lock:
+            return self.get_test_counts(), self.test_results[start:stop]
 
     def display_test_summary(self):
         """Display a summary of all test results."""
@@ -591,89 +1176,151 @@ class FunctionTester:
         print("📊 TEST SUMMARY")
         print("=" * 80)
 
-        total_tests = len(self.test_results)
-        successful_executions = sum(1 for test in self.test_results if test["success"])
-        verified_passed = sum(1 for test in self.test_results if test["verification"] == "PASSED")
-        verified_failed = sum(1 for test in self.test_results if test["verification"] == "FAILED")
-        unverified = sum(1 for test in self.test_results if test["verification"] is None and test["success"])
-
-        print(f"Total Tests: {total_tests}")
-        print(f"Successful Executions: {successful_executions}")
-        print(f"Execution Errors: {total_tests - successful_executions}")
-        print(f"Verified Passed: {verified_passed}")
-        print(f"Verified Failed: {verified_failed}")
-        print(f"Unverified: {unverified}")
+        counts = self.get_test_counts()
+
+        print(f"Total Tests: {counts['total_tests']}")
+        print(f"Successful Executions: {counts['successful_executions']}")
+        print(f"Execution Errors: {counts['total_tests'] - counts['successful_executions']}")
+        print(f"Verified Passed: {counts['verified_passed']}")
+        print(f"Verified Failed: {counts['verified_failed']}")
+        print(f"Unverified: {counts['unverified']}")
         print("-" * 80)
 
         for i, test in enumerate(self.test_results, 1):
-            status_icon = "✅" if test["success"] else "❌"
+            status_icon = "✅" if test.success else "❌"
             verification_icon = ""
-            if test["verification"] == "PASSED":
+            if test.verification == "PASSED":
                 verification_icon = " ✅"
-            elif test["verification"] == "FAILED":
+            elif test.verification == "FAILED":
                 verification_icon = " ❌"
-            elif test["success"]:
+            elif test.success:
                 verification_icon = " ❓"
 
-            print(f"{i:2d}. {status_icon} {test['function_name']}{verification_icon}")
-            print(f"    Input:  {test['inputs']}")
-            print(f"    Output: {test['output']}")
-            print(f"    Time:   {test['timestamp']}")
-            if not test["success"]:
+            print(f"{i:2d}. {status_icon} {test.function_name}{verification_icon}")
+            print(f"    Input:  {test.inputs}")
+            print(f"    Output: {test.output}")
+            print(f"    Time:   {self.format_timestamp(test.timestamp_ns)}")
+            if not test.success:
                 print(f"    Status: EXECUTION ERROR")
-            elif test["verification"]:
-                print(f"    Status: VERIFICATION {test['verification']}")
+            elif test.verification:
+                print(f"    Status: VERIFICATION {test.verification}")
             else:
                 print(f"    Status: NOT VERIFIED")
             print()
 
         print("=" * 80)
 
+    def _result_cache_key(self, func: Union[Callable, Dict], inputs: Dict[str, Any]) -> Optional[Tuple]:
+        """Build a memoization key for a call, or None if the call should not be cached."""
+        if isinstance(func, dict) and "method" in func:
+            # Instance and class methods depend on object/class state
+            if func["type"] != "static":
+                return None
+            func = func["method"]
+
+        # Keyed on the function itself: an id() can be reused once a reloaded module's functions are freed
+        key = (func, tuple(sorted((name, _typed_value_key(value)) for name, value in inputs.items())))
+        try:
+            hash(key)
+        except TypeError:  # Unhashable input values (lists, dicts, ...)
+            return None
+        return key
+
     def run_test(self, func: Union[Callable, Dict], inputs: Dict[str, Any]) -> Tuple[Any, bool]:
         """Run the function with given inputs and return result and success status."""
+        cache_key = self._result_cache_key(func, inputs) if self.cache_results else None
+        if cache_key is not None and cache_key in self._result_cache:
+            return copy.deepcopy(self._result_cache[cache_key]), True  # Callers may mutate the result they get
+
         try:
-            # Handle class methods
-            if isinstance(func, dict) and "method" in func:
-                method_info = func
-                method = method_info["method"]
-                cls = method_info["class"]
-                method_type = method_info["type"]
-
-                if method_type == "static":
-                    # Static method - call directly
-                    result = method(**inputs)
-                elif method_type == "class":
-                    # Class method - call with class
-                    result = method(**inputs)
-                else:
-                    # Instance method - need to create instance first
-                    if "self" in inputs:
-                        # Use provided instance
-                        instance = inputs.pop("self")
-                        result = method(instance, **inputs)
-                    else:
-                        # Create new instance
-                        try:
-                            instance = cls()  # Try default constructor
-                            result = method(instance, **inputs)
-                        except Exception:
-                            # If default constructor fails, ask for parameters
-                            print(f"Need to create {cls.__name__} instance for method {method_info['name']}")
-                            available_classes = self.discover_available_classes()
-                            instance = self._create_class_instance(cls, available_classes)
-                            if instance is None:
-                                return "Could not create class instance", False
-                            result = method(instance, **inputs)
-
-                return result, True
-            else:
+            if not isinstance(func, dict):
                 # Regular function
                 result = func(**inputs)
-                return result, True
+            elif func["type"] != "instance":
+                # Static and class methods are already bound by getattr - call directly
+                result = func["method"](**inputs)
+            else:
+                # Instance method - use the provided instance or create one first
+                if "self" in inputs:
+                    instance = inputs.pop("self")
+                elif func.get("default_constructible", True):
+                    instance = func["class"]()
+                else:
+                    # Constructor needs arguments, ask for parameters
+                    cls = func["class"]
+                    print(f"Need to create {cls.__name__} instance for method {func['name']}")
+                    available_classes = self.discover_available_classes()
+                    instance = self._create_class_instance(cls, available_classes)
+                    if instance is None:
+                        return "Could not create class instance", False
+                result = func["method"](instance, **inputs)
+
+            # Coroutine functions (async def) are run to completion
+            if inspect.iscoroutine(result):
+                import asyncio  # Imported on first use - it adds ~40ms to every startup otherwise
+
+                result = asyncio.run(result)
+
+            if cache_key is not None:
+                try:
+                    self._result_cache[cache_key] = copy.deepcopy(result)
+                except Exception:
+                    pass  # Results that cannot be copied are not cached
+            return result, True
         except Exception as e:
             print(f"Error executing function: {e}")
             return str(e), False
 
+    def prompt_for_batch_inputs(self) -> List[Dict[str, Any]]:
+        """Prompt for a JSON file containing a list of input dicts for batch testing."""
+        path = input("Path to JSON file with a list of input objects: ").strip()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                batch = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read batch inputs: {e}")
+            return []
+
+        if not isinstance(batch, list) or not all(isinstance(inputs, dict) for inputs in batch):
+            print("Batch file must contain a JSON list of objects mapping parameter names to values.")
+            return []
+
+        return batch
+
+    def run_batch(self, func: Union[Callable, Dict], batch: List[Dict[str, Any]]) -> List[Tuple[Any, bool]]:
+        """Run a function over many input dicts, track every result, and print one combined report."""
+        funcname = func.__name__ if callable(func) else func["name"]
+
+        # Hoist attribute lookups out of the loop; results are written in a single call at the end
+        run_test = self.run_test
+        add_test_result = self.add_test_result
+        outcomes = []
+        lines = []
+
+        for i, inputs in enumerate(batch, 1):
+            result, success = run_test(func, inputs)
+            add_test_result(funcname, inputs, result, success, None)
+            outcomes.append((result, success))
+            lines.append(f"Test {i}: {inputs} -> {result}" if success else f"Test {i}: {inputs} -> ✗ Error: {result}")
+
+        sys.stdout.write(f"\nRan {len(batch)} test cases for {funcname}:\n" + "\n".join(lines) + "\n")
+        return outcomes
+
+    def _build_menu_pages(self, func_list: List[str]) -> List[str]:
+        """Pre-format the numbered function menu as ready-to-write pages of _MENU_PAGE_SIZE entries."""
+        lines = [f"{i}. {func_key}" for i, func_key in enumerate(func_list, 1)]
+        header = f"\nFound {len(func_list)} functions:\n"
+
+        if len(lines) <= _MENU_PAGE_SIZE:
+            return [header + "\n".join(lines) + "\n"]
+
+        pages = []
+        for start in range(0, len(lines), _MENU_PAGE_SIZE):
+            end = min(start + _MENU_PAGE_SIZE, len(lines))
+            footer = f"(showing {start + 1}-{end} of {len(lines)}, enter 'm' for more)"
+            pages.append(header + "\n".join(lines[start:end]) + "\n" + footer + "\n")
+        return pages
+
     def interactive_testing_session(self):
         """Main interactive testing loop."""
         print("Python Function Testing Tool")
@@ -681,7 +1328,14 @@ class FunctionTester:
 
         # Discover functions
         print("Discovering functions and classes...")
-        functions = self.discover_functions()
+        found = 0
+        for found, _ in enumerate(self.iter_discover(), 1):
+            if found % 200 == 0:
+                sys.stdout.write(f"\r  {found} functions found so far...")
+                sys.stdout.flush()
+        if found >= 200:
+            sys.stdout.write("\n")
+        functions = self.discovered_functions
 
         if not functions:
             print("No functions found in the current directory.")
@@ -691,26 +1345,41 @@ class FunctionTester:
         if self.discovered_classes:
             print("Available classes:", ", ".join(self.discovered_classes.keys()))
 
+        # The function list does not change during the session - format the menu once
+        func_list = list(functions.keys())
+        menu_pages = self._build_menu_pages(func_list)
+        page = 0
+        show_menu = True
+
         while True:
-            # Display available functions
-            print(f"\nFound {len(functions)} functions:")
-            func_list = list(functions.keys())
-            for i, func_key in enumerate(func_list, 1):
-                print(f"{i}. {func_key}")
+            # Display available functions, one page at a time, in a single write - only
+            # on the first pass or when asked, not after every test
+            if show_menu:
+                sys.stdout.write(menu_pages[page])
+                show_menu = False
 
             # Get user selection
             try:
-                choice = input("\nSelect function number (or 'q' to quit): ").strip()
+                choice = input("\nSelect function number ('r' to list functions, 'q' to quit): ").strip()
                 if choice.lower() == "q":
                     break
+                if choice.lower() == "r":
+                    show_menu = True
+                    continue
+                if len(menu_pages) > 1 and choice.lower() == "m":
+                    page = (page + 1) % len(menu_pages)
+                    show_menu = True
+                    continue
 
                 func_index = int(choice) - 1
                 if 0 <= func_index < len(func_list):
                     selected_key = func_list[func_index]
-                    selected_func = functions[selected_key]
+                    selected_func = self.get_function(selected_key)
+                    if selected_func is None:
+                        continue
 
                     # Ask for testing mode
-                    mode = input("\nTesting mode:\n1. Manual input\n2. Auto-generate inputs\n3. Batch test (multiple auto-generated inputs)\nSelect mode (1-3, default: 1): ").strip()
+                    mode = input("\nTesting mode:\n1. Manual input\n2. Auto-generate inputs\n3. Batch test (multiple auto-generated inputs)\n4. Batch test from JSON file\nSelect mode (1-4, default: 1): ").strip()
 
                     if mode == "3":
                         # Batch testing mode
@@ -723,30 +1392,53 @@ class FunctionTester:
                         print(f"\nRunning {num_tests} auto-generated test cases for {selected_func.__name__}:")
                         print("-" * 50)
 
-                        for i in range(num_tests):
-                            inputs = self.generate_intelligent_inputs(selected_func)
-                            print(f"\nTest {i+1}: {inputs}")
-                            result, success = self.run_test(selected_func, inputs)
-
-                            verification = None
-                            if success:
-                                print(f"Result: {result}")
-                                expected = input("Expected? (y/n/s to skip remaining): ").strip().lower()
-                                if expected == "y":
-                                    print("✓ Test passed!")
-                                    verification = "PASSED"
-                                elif expected == "s":
-                                    # Track this test as unverified before breaking
-                                    self.add_test_result(selected_func.__name__, inputs, result, success, None)
-                                    break
+                        # With the LLM enabled each case is a network round trip, so the next few are generated
+                        # while this one is verified - only a few ahead, so skipping does not pay for the rest.
+                        # Workers collect their messages instead of printing over the verification prompt.
+                        self.discover_available_classes()  # Resolve class references before worker threads read them
+                        executor = ThreadPoolExecutor(max_workers=min(_BATCH_PREFETCH + 1, max(num_tests, 1)))
+                        input_futures = deque(executor.submit(self._generate_inputs_quietly, selected_func) for _ in range(min(_BATCH_PREFETCH + 1, num_tests)))
+                        submitted = len(input_futures)
+                        try:
+                            for i in range(num_tests):
+                                inputs, messages = input_futures.popleft().result()
+                                if submitted < num_tests:
+                                    input_futures.append(executor.submit(self._generate_inputs_quietly, selected_func))
+                                    submitted += 1
+
+                                for message in messages:
+                                    print(message)
+                                print(f"\nTest {i+1}: {inputs}")
+                                result, success = self.run_test(selected_func, inputs)
+
+                                verification = None
+                                if success:
+                                    print(f"Result: {result}")
+                                    expected = input("Expected? (y/n/s to skip remaining): ").strip().lower()
+                                    if expected == "y":
+                                        print("✓ Test passed!")
+                                        verification = "PASSED"
+                                    elif expected == "s":
+                                        # Track this test as unverified before breaking
+                                        self.add_test_result(selected_func.__name__, inputs, result, success, None)
+                                        break
+                                    else:
+                                        print("✗ Test failed - output not as expected")
+                                        verification = "FAILED"
                                 else:
-                                    print("✗ Test failed - output not as expected")
-                                    verification = "FAILED"
-                            else:
-                                print(f"✗ Error: {result}")
-
-                            # Track the test result
-                            self.add_test_result(selected_func.__name__, inputs, result, success, verification)
+                                    print(f"✗ Error: {result}")
+
+                                # Track the test result
+                                self.add_test_result(selected_func.__name__, inputs, result, success, verification)
+                        finally:
+                            for input_future in input_futures:
+                                input_future.cancel()  # Cases not started yet are dropped; running ones finish unseen
+                            executor.shutdown(wait=False)
+                    elif mode == "4":
+                        # Batch testing from a file of input dicts
+                        batch = self.prompt_for_batch_inputs()
+                        if batch:
+                            self.run_batch(selected_func, batch)
                     else:
                         # Single test mode
                         auto_generate = mode == "2"
@@ -800,6 +1492,8 @@ def main():
     parser.add_argument("--api-key", "-k", help="OpenAI API key for intelligent input generation (optional)")
     parser.add_argument("--web", "-w", action="store_true", help="Launch web interface instead of terminal")
     parser.add_argument("--port", "-p", type=int, default=8080, help="Port for web interface (default: 8080)")
+    parser.add_argument("--cache-results", action="store_true", help="Reuse results of repeated calls with identical inputs (only for functions without side effects)")
+    parser.add_argument("--test-timeout", type=float, default=30.0, help="Seconds the web interface waits for a tested function before reporting a timeout (default: 30)")
 
     args = parser.parse_args()
 
@@ -813,7 +1507,7 @@ def main():
     else:
         print("📝 Using rule-based input generation (use --api-key or set OPENAI_API_KEY for LLM analysis)")
 
-    tester = FunctionTester(args.directory, api_key)
+    tester = FunctionTester(args.directory, api_key, args.cache_results)
 
     if args.web:
         # Launch web interface
@@ -829,7 +1523,7 @@ def main():
         print(f"✅ Found {len(tester.discovered_functions)} functions and {len(tester.discovered_classes)} classes")
         if tester.discovered_classes:
             print("Available classes:", ", ".join(tester.discovered_classes.keys()))
-        start_web_interface(tester, args.port)
+        start_web_interface(tester, args.port, args.test_timeout)
     else:
         # Launch terminal interface
         tester.interactive_testing_session()
@@ -2,9 +2,43 @@
 Sample functions for testing the function tester tool.
 """
 
-import torch
-import torch.nn as nn
-import torch.optim as optim
+import functools
+import math
+import string
+from collections import deque
+
+
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+_TEMPERATURE_FORMAT = "{}°C = {}°F".format
+
+
+def _njit(signature):
+    """Compile a numeric function for one explicit signature with numba.njit(cache=True) on its first call.
+
+    numba is imported lazily so loading this module stays cheap, and the plain
+    Python function is used when numba is not installed. The explicit signature
+    means one compilation (reused from the on-disk cache on later runs) instead of
+    one per combination of int/float argument types.
+    """
+
+    def decorator(func):
+        compiled = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal compiled
+            if compiled is None:
+                try:
+                    from numba import njit
+
+                    compiled = njit(signature, cache=True)(func)
+                except ImportError:
+                    compiled = func
+            return compiled(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 def reverse_string(text):
@@ -12,41 +46,82 @@ def reverse_string(text):
     return text[::-1]
 
 
+@_njit("int64(int64)")
+def _factorial_loop(n):
+    acc = 1
+    for i in range(2, n + 1):
+        acc *= i
+    return acc
+
+
+@functools.lru_cache(maxsize=1024)
 def factorial(n):
     """Calculate factorial of a number."""
     if n < 0:
         raise ValueError("Factorial not defined for negative numbers")
-    if n == 0 or n == 1:
-        return 1
-    return n * factorial(n - 1)
+    if n > 20:  # 21! overflows the compiled int64 loop - use Python integers
+        return _factorial_loop.__wrapped__(n)
+    return _factorial_loop(n)
 
 
+@_njit("float64(float64, float64)")
 def calculate_bmi(weight, height):
     """Calculate Body Mass Index given weight in kg and height in meters."""
     return weight / (height**2)
 
 
+@_njit("float64(float64, float64, float64, float64)")
 def calculate_distance(x1, y1, x2, y2):
     """Calculate Euclidean distance between two points."""
-    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    return math.hypot(x2 - x1, y2 - y1)
 
 
 def format_temperature(temp_celsius):
     """Convert temperature from Celsius to Fahrenheit and format."""
-    fahrenheit = (temp_celsius * 9 / 5) + 32
-    return f"{temp_celsius}°C = {fahrenheit}°F"
+    return _TEMPERATURE_FORMAT(temp_celsius, (temp_celsius * 9 / 5) + 32)
 
 
+@_njit("boolean(float64)")
 def validate_percentage(percentage):
     """Check if a percentage value is valid (0-100)."""
     return 0 <= percentage <= 100
 
 
+_NUMPY_SUM_MIN_SIZE = 1024  # Below this, array construction costs more than numpy's vectorized sum saves
+_INT64_MAX = 2**63 - 1
+
+
+def _sum_numbers(numbers):
+    """Sum numbers, using numpy's vectorized reduction for long sequences when numpy is installed.
+
+    numpy is only used where it matches sum(): a flat sequence that numpy stores as float64
+    (floats, possibly with ints mixed in), or as int64 with a total that cannot overflow.
+    Everything else (all-bool sequences, Decimals, ints beyond 64 bits, strings, ragged or
+    nested sequences) is summed by sum().
+    """
+    if len(numbers) >= _NUMPY_SUM_MIN_SIZE:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            try:
+                array = np.asarray(numbers)
+            except (ValueError, TypeError, OverflowError):
+                array = None
+            if array is not None and array.ndim == 1:
+                if array.dtype.kind == "f":
+                    return float(array.sum())  # Pairwise summation - may differ from sum() in the last bits
+                if array.dtype.kind == "i" and max(-int(array.min()), int(array.max())) * len(array) <= _INT64_MAX:
+                    return int(array.sum())
+    return sum(numbers)
+
+
 def process_numbers_list(numbers):
     """Calculate sum and average of a list of numbers."""
     if not numbers:
         return {"sum": 0, "average": 0}
-    total = sum(numbers)
+    total = _sum_numbers(numbers)
     return {"sum": total, "average": total / len(numbers)}
 
 
@@ -118,12 +193,11 @@ def compare_people_ages(person1, person2):
 
 
 def create_in_out_sequences(data, seq_length):
-    in_seq = []
-    out_seq = []
-    for i in range(len(data) - seq_length):
-        in_seq.append(data[i : i + seq_length])
-        out_seq.append(data[i + seq_length])
-    return torch.stack(in_seq), torch.stack(out_seq)
+    """Split a sequence tensor into sliding input windows and the element that follows each window."""
+    # unfold() returns the windows as a strided view (window dim last), so nothing is copied
+    in_seq = data.unfold(0, seq_length, 1)[:-1].movedim(-1, 1)
+    out_seq = data[seq_length:]
+    return in_seq, out_seq
 
 
 # Classes with methods for testing
@@ -188,16 +262,14 @@ class StringProcessor:
     @staticmethod
     def remove_punctuation(text):
         """Remove punctuation from text (static method)."""
-        import string
-
-        return text.translate(str.maketrans("", "", string.punctuation))
+        return text.translate(_PUNCTUATION_TABLE)
 
 
 class BankAccountAdvanced:
     def __init__(self, account_number, initial_balance=0.0):
         self.account_number = account_number
         self.balance = initial_balance
-        self.transaction_history = []
+        self.transaction_history = deque()  # (kind, amount) pairs, formatted only when read
 
     def deposit(self, amount):
         """Deposit money into the account."""
@@ -205,7 +277,7 @@ class BankAccountAdvanced:
             return "Invalid deposit amount"
 
         self.balance += amount
-        self.transaction_history.append(f"Deposit: +${amount}")
+        self.transaction_history.append(("Deposit", amount))
         return f"Deposited ${amount}. New balance: ${self.balance}"
 
     def withdraw(self, amount):
@@ -217,7 +289,7 @@ class BankAccountAdvanced:
             return "Insufficient funds"
 
         self.balance -= amount
-        self.transaction_history.append(f"Withdrawal: -${amount}")
+        self.transaction_history.append(("Withdrawal", amount))
         return f"Withdrew ${amount}. New balance: ${self.balance}"
 
     def get_balance(self):
@@ -226,7 +298,7 @@ class BankAccountAdvanced:
 
     def get_transaction_history(self):
         """Get transaction history."""
-        return self.transaction_history.copy()
+        return [f"{kind}: {'+' if kind == 'Deposit' else '-'}${amount}" for kind, amount in self.transaction_history]
 
     @staticmethod
     def validate_account_number(account_number):
@@ -4,24 +4,121 @@ Web interface for Python Function Testing Tool
 Provides an HTML-based interface for testing functions.
 """
 
+import gzip
+import hashlib
 import json
+import os
 import threading
+import zlib
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
 import inspect
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional
 from urllib.parse import parse_qs, urlparse
-from function_tester import FunctionTester
-from json import JSONEncoder
+from function_tester import FunctionTester, _dumps_json
 
+try:
+    import orjson  # Optional: several times faster than the json module
+except ImportError:
+    orjson = None
 
-class JEncoder(JSONEncoder):
-    def default(self, o):
-        return o.__dict__
+
+# Test records serialized per write while streaming the summary
+_SUMMARY_BATCH_SIZE = 100
+
+# Distinguishes this server's summary ETags from those of earlier runs, whose results_version also started at 0
+_SUMMARY_ETAG_PREFIX = os.urandom(6).hex()
+
+# Largest POST body accepted, so a bad Content-Length cannot make a handler buffer unbounded data
+_MAX_BODY_SIZE = 4 * 1024 * 1024
+
+# JSON bodies shorter than this are sent uncompressed - gzip's header and trailer outweigh the saving
+_GZIP_MIN_SIZE = 512
+
+
+def _is_test_request(func_key, inputs) -> bool:
+    """Check the shape of a test or verification request item: a string function key and a dict of inputs."""
+    return isinstance(func_key, str) and isinstance(inputs, dict)
+
+
+def _etag(body: bytes) -> str:
+    """Return a strong ETag (quoted content hash) for a cached response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _loads_json(data: bytes):
+    """Parse a JSON request body (bytes) with orjson when installed, else the json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)  # Accepts UTF-8 bytes as well, no decode() copy needed
+
+
+class TimedTestRunner:
+    """Run tested functions on a thread pool, abandoning calls that take longer than a timeout.
+
+    An abandoned call cannot be interrupted and keeps its worker until it returns. Once hung
+    calls hold every worker the pool is replaced, so later tests do not queue behind them.
+    """
+
+    def __init__(self, timeout: float, max_workers: Optional[int] = None):
+        self.timeout = timeout
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self._hung = 0  # Abandoned calls of the current pool that are still running
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        """Create a worker pool for tested functions."""
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="test")
+
+    def run(self, func, *args):
+        """Call func(*args) and return its result, or a (message, False) test outcome if it timed out."""
+        with self._lock:
+            if self._hung >= self.max_workers:
+                # The old pool's threads finish their hung calls (if ever) and then exit
+                self._executor.shutdown(wait=False)
+                self._executor = self._new_executor()
+                self._hung = 0
+            executor = self._executor
+            future = executor.submit(func, *args)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                # Never started: every worker was still busy with earlier calls
+                return f"No free test worker within {self.timeout} seconds - earlier calls are still running", False
+
+            with self._lock:
+                if executor is self._executor:
+                    self._hung += 1
+            future.add_done_callback(lambda _: self._release(executor))
+            return f"Timed out after {self.timeout} seconds", False
+
+    def _release(self, executor: ThreadPoolExecutor):
+        """Count an abandoned call as no longer hung once it returns."""
+        with self._lock:
+            if executor is self._executor:
+                self._hung -= 1
+
+    def shutdown(self):
+        """Stop accepting calls without waiting for running ones."""
+        with self._lock:
+            self._executor.shutdown(wait=False)
 
 
 class WebTestingHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, tester=None, **kwargs):
+    # Keep-alive: the page's back-to-back API calls reuse one connection instead of reconnecting each time
+    protocol_version = "HTTP/1.1"
+    # Buffer the socket writer so headers and body leave in one send (flushed after each request)
+    wbufsize = 65536
+
+    def __init__(self, *args, tester=None, info_cache=None, test_runner=None, **kwargs):
         self.tester = tester
+        self.info_cache = info_cache if info_cache is not None else {}  # {func_key: (function, serialized info)}
+        self.test_runner = test_runner  # TimedTestRunner, so a call can be abandoned after its timeout
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
@@ -37,7 +134,7 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             func_key = query.get("key", [""])[0]
             self.serve_function_info(func_key)
         elif parsed_path.path == "/api/test-summary":
-            self.serve_test_summary()
+            self.serve_test_summary(parse_qs(parsed_path.query))
         else:
             self.send_error(404)
 
@@ -47,38 +144,127 @@ class WebTestingHandler(BaseHTTPRequestHandler):
 
         if parsed_path.path == "/api/test-function":
             self.handle_test_function()
+        elif parsed_path.path == "/api/test-functions-batch":
+            self.handle_test_functions_batch()
         elif parsed_path.path == "/api/generate-inputs":
             self.handle_generate_inputs()
         elif parsed_path.path == "/api/verify-result":
             self.handle_verify_result()
+        elif parsed_path.path == "/api/verify-results-batch":
+            self.handle_verify_results_batch()
         else:
+            self.close_connection = True  # The unread request body would be parsed as the next request
             self.send_error(404)
 
-    def serve_main_page(self):
-        """Serve the main HTML page."""
-        html_content = self.get_html_template()
+    def read_json_body(self):
+        """Read and parse the request's JSON object body, or send an error response and return None."""
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            content_length = -1
+        if not 0 <= content_length <= _MAX_BODY_SIZE:
+            self.close_connection = True  # The body is left unread
+            self.send_error(413 if content_length > _MAX_BODY_SIZE else 400)
+            return None
+
+        try:
+            data = _loads_json(self.rfile.read(content_length))  # orjson parses the bytes directly
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            self.send_error(400, "Request body must be a JSON object")
+            return None
+        return data
+
+    def accepts_gzip(self):
+        """Check whether the client accepts gzip-encoded responses."""
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
+    def send_body(self, body, content_type="application/json", gzip_body=None):
+        """Send a 200 response with body (bytes); every response needs a Content-Length to keep the connection open.
+
+        Bodies of _GZIP_MIN_SIZE bytes or more are gzipped at level 1 for clients that accept it;
+        gzip_body passes a precompressed copy of a cached body instead.
+        """
+        use_gzip = len(body) >= _GZIP_MIN_SIZE and self.accepts_gzip()
+        if use_gzip:
+            body = gzip_body if gzip_body is not None else gzip.compress(body, compresslevel=1)
 
         self.send_response(200)
-        self.send_header("Content-type", "text/html")
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
         self.end_headers()
-        self.wfile.write(html_content.encode())
+        self.wfile.write(body)
 
-    def serve_functions_list(self):
-        """Serve the list of discovered functions."""
-        functions = list(self.tester.discovered_functions.keys())
+    def send_cached(self, body, body_gzip, etag, content_type="application/json"):
+        """Send a cached body (bytes) with its ETag, or a bodyless 304 when the browser's copy is current.
+
+        body_gzip is the precompressed copy sent to clients that accept gzip (None to always send body).
+        """
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        use_gzip = body_gzip is not None and self.accepts_gzip()
+        if use_gzip:
+            body = body_gzip
 
         self.send_response(200)
-        self.send_header("Content-type", "application/json")
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")  # Revalidate every time; unchanged bodies cost a 304
         self.end_headers()
-        self.wfile.write(json.dumps(functions).encode())
+        self.wfile.write(body)
+
+    _main_page = None  # (UTF-8 bytes, gzipped bytes, ETag) of the static template, built on first request
+
+    def serve_main_page(self):
+        """Serve the main HTML page."""
+        if WebTestingHandler._main_page is None:
+            html_bytes = self.get_html_template().encode()
+            WebTestingHandler._main_page = (html_bytes, gzip.compress(html_bytes, compresslevel=9), _etag(html_bytes))
+        self.send_cached(*WebTestingHandler._main_page, content_type="text/html")
+
+    _functions_list = None  # (discovered_functions dict, JSON bytes, gzipped JSON bytes or None, ETag) - rediscovery replaces the dict
+
+    def serve_functions_list(self):
+        """Serve the list of discovered functions."""
+        functions = self.tester.discovered_functions
+        cached = WebTestingHandler._functions_list
+        if cached is None or cached[0] is not functions:
+            body = _dumps_json(list(functions.keys()))
+            body_gzip = gzip.compress(body, compresslevel=9) if len(body) >= _GZIP_MIN_SIZE else None
+            cached = WebTestingHandler._functions_list = (functions, body, body_gzip, _etag(body))
+        self.send_cached(*cached[1:])
 
     def serve_function_info(self, func_key):
         """Serve information about a specific function."""
-        if func_key not in self.tester.discovered_functions:
+        func = self.tester.get_function(func_key)
+        if func is None:
             self.send_error(404)
             return
 
-        func = self.tester.discovered_functions[func_key]
+        # The info only changes when the function is rediscovered (a new object for the same key)
+        cached = self.info_cache.get(func_key)
+        if cached is not None and cached[0] is func:
+            body = cached[1]
+        else:
+            body = _dumps_json(self.build_function_info(func))
+            self.info_cache[func_key] = (func, body)
+
+        self.send_body(body)
+
+    def build_function_info(self, func):
+        """Describe a function's parameters, defaults and class-typed parameters for the UI."""
         params, defaults, annotations = self.tester.get_function_signature(func)
 
         # Get available classes
@@ -110,62 +296,81 @@ class WebTestingHandler(BaseHTTPRequestHandler):
                 class_info[param] = {"class_name": annotation.__name__, "parameters": class_params, "defaults": class_defaults}
             else:
                 # Check heuristically for class parameters
-                for class_name, class_type in available_classes.items():
-                    if param.lower().endswith(class_name.lower()) or param.lower().replace("_", "").endswith(class_name.lower()) or class_name.lower() in param.lower():
-                        class_params, class_defaults = self.tester.get_class_constructor_info(class_type)
-                        class_info[param] = {"class_name": class_name, "parameters": class_params, "defaults": class_defaults, "suggested": True}  # Mark as suggested, not definite
-                        break
-
-        info = {"name": func_name, "docstring": docstring, "parameters": params, "defaults": defaults, "class_info": class_info, "available_classes": list(available_classes.keys()), "is_method": is_method, "method_details": method_details}
+                match = self.tester.match_class_for_parameter(param)
+                if match:
+                    class_name, class_type = match
+                    class_params, class_defaults = self.tester.get_class_constructor_info(class_type)
+                    class_info[param] = {"class_name": class_name, "parameters": class_params, "defaults": class_defaults, "suggested": True}  # Mark as suggested, not definite
 
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(info).encode())
+        return {"name": func_name, "docstring": docstring, "parameters": params, "defaults": defaults, "class_info": class_info, "available_classes": list(available_classes.keys()), "is_method": is_method, "method_details": method_details}
 
     def handle_generate_inputs(self):
         """Generate intelligent inputs for a function."""
-        content_length = int(self.headers["Content-Length"])
-        post_data = self.rfile.read(content_length)
-        data = json.loads(post_data.decode())
+        data = self.read_json_body()
+        if data is None:
+            return
 
         func_key = data.get("function_key")
-        if func_key not in self.tester.discovered_functions:
+        func = self.tester.get_function(func_key)
+        if func is None:
             self.send_error(404)
             return
 
-        func = self.tester.discovered_functions[func_key]
         inputs = self.tester.generate_intelligent_inputs(func)
 
-        # Convert any non-serializable values to strings
-        serializable_inputs = {}
-        for key, value in inputs.items():
-            try:
-                json.dumps(value)
-                serializable_inputs[key] = value
-            except (TypeError, ValueError):
-                serializable_inputs[key] = str(value)
-
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(serializable_inputs).encode())
+        self.send_body(_dumps_json(inputs, default=str))  # Non-serializable values are sent as strings
 
     def handle_test_function(self):
         """Execute a function with provided inputs."""
-        content_length = int(self.headers["Content-Length"])
-        post_data = self.rfile.read(content_length)
-        data = json.loads(post_data.decode())
+        data = self.read_json_body()
+        if data is None:
+            return
 
         func_key = data.get("function_key")
         inputs = data.get("inputs", {})
+        if not _is_test_request(func_key, inputs):
+            self.send_error(400, "Expected a string function_key and an inputs object")
+            return
 
-        if func_key not in self.tester.discovered_functions:
+        response = self.run_test_request(func_key, inputs, self.tester.discover_available_classes())
+        if response is None:
             self.send_error(404)
             return
 
+        self.send_body(_dumps_json(response, default=str))  # Non-serializable results and inputs are sent as strings
+
+    def handle_test_functions_batch(self):
+        """Execute several {"function_key", "inputs"} tests from one request and respond with their results in order."""
+        data = self.read_json_body()
+        if data is None:
+            return
+
+        tests = data.get("tests", [])
+        if not isinstance(tests, list):
+            self.send_error(400, "tests must be a list")
+            return
+
+        available_classes = self.tester.discover_available_classes()  # Looked up once for the whole batch
+        responses = []
+        for test in tests:
+            if not isinstance(test, dict) or not _is_test_request(test.get("function_key"), test.get("inputs", {})):
+                responses.append({"success": False, "result": "Invalid test: expected a string function_key and an inputs object", "inputs_used": None})
+                continue
+            inputs = test.get("inputs", {})
+            response = self.run_test_request(test.get("function_key"), inputs, available_classes)
+            if response is None:
+                response = {"success": False, "result": "Function not found", "inputs_used": inputs}
+            responses.append(response)
+
+        self.send_body(_dumps_json(responses, default=str))
+
+    def run_test_request(self, func_key, inputs, available_classes):
+        """Run one test from the web UI and record it, returning the response dict (None if the function is unknown)."""
+        func = self.tester.get_function(func_key)
+        if func is None:
+            return None
+
         # Process class inputs
-        available_classes = self.tester.discover_available_classes()
         processed_inputs = {}
 
         for param, value in inputs.items():
@@ -187,42 +392,50 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             else:
                 processed_inputs[param] = value
 
-        func = self.tester.discovered_functions[func_key]
-        result, success = self.tester.run_test(func, processed_inputs)
+        if self.test_runner is None:
+            result, success = self.tester.run_test(func, processed_inputs)
+        else:
+            result, success = self.test_runner.run(self.tester.run_test, func, processed_inputs)
 
         # Track the test result
         func_name = func_key.split("::")[-1] if "::" in func_key else func_key
         self.tester.add_test_result(func_name, processed_inputs, result, success, None)
 
-        # Convert result to serializable format
-        try:
-            json.dumps(result)
-            serializable_result = result
-        except (TypeError, ValueError):
-            serializable_result = str(result)
-
-        # Convert processed inputs to serializable format for response
-        serializable_inputs = {}
-        for key, value in processed_inputs.items():
-            try:
-                json.dumps(value)
-                serializable_inputs[key] = value
-            except (TypeError, ValueError):
-                serializable_inputs[key] = str(value)
-
-        response = {"success": success, "result": serializable_result, "inputs_used": serializable_inputs}
-
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        return {"success": success, "result": result, "inputs_used": processed_inputs}
 
     def handle_verify_result(self):
         """Handle verification of test results."""
-        content_length = int(self.headers["Content-Length"])
-        post_data = self.rfile.read(content_length)
-        data = json.loads(post_data.decode())
+        data = self.read_json_body()
+        if data is None:
+            return
+        if not _is_test_request(data.get("function_key"), data.get("inputs", {})):
+            self.send_error(400, "Expected a string function_key and an inputs object")
+            return
+
+        self.send_body(_dumps_json(self.verify_request(data)))
+
+    def handle_verify_results_batch(self):
+        """Record several verifications from one {"verifications": [...]} request and respond with their results in order."""
+        data = self.read_json_body()
+        if data is None:
+            return
+
+        verifications = data.get("verifications", [])
+        if not isinstance(verifications, list):
+            self.send_error(400, "verifications must be a list")
+            return
+
+        responses = []
+        for verification in verifications:
+            if isinstance(verification, dict) and _is_test_request(verification.get("function_key"), verification.get("inputs", {})):
+                responses.append(self.verify_request(verification))
+            else:
+                responses.append({"success": False, "error": "Invalid verification: expected a string function_key and an inputs object"})
+
+        self.send_body(_dumps_json(responses))
 
+    def verify_request(self, data):
+        """Record one verification from the web UI and return the response dict."""
         func_key = data.get("function_key")
         is_correct = data.get("is_correct")
         test_inputs = data.get("inputs", {})
@@ -232,10 +445,7 @@ class WebTestingHandler(BaseHTTPRequestHandler):
         func_name = func_key.split("::")[-1] if "::" in func_key else func_key
 
         # Find and update the most recent test result for this function
-        for test in reversed(self.tester.test_results):
-            if test["function_name"] == func_name and test["inputs"] == test_inputs and test["verification"] is None:
-                test["verification"] = "PASSED" if is_correct else "FAILED"
-                break
+        self.tester.record_verification(func_name, test_inputs, is_correct)
 
         # Log the verification (could be extended to save to file/database)
         verification_log = {
@@ -243,39 +453,70 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             "inputs": test_inputs,
             "result": test_result,
             "verification": "PASSED" if is_correct else "FAILED",
-            "timestamp": __import__("datetime").datetime.now().isoformat(),
+            "timestamp": datetime.now().isoformat(),
         }
 
         print(f"📝 Test Verification: {func_key} - {'PASSED' if is_correct else 'FAILED'}")
 
-        response = {"success": True, "verification": verification_log}
-
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        return {"success": True, "verification": verification_log}
 
-    def serve_test_summary(self):
-        """Serve the test summary data."""
-        summary_data = {"total_tests": len(self.tester.test_results), "successful_executions": sum(1 for test in self.tester.test_results if test["success"]), "verified_passed": sum(1 for test in self.tester.test_results if test["verification"] == "PASSED"), "verified_failed": sum(1 for test in self.tester.test_results if test["verification"] == "FAILED"), "unverified": sum(1 for test in self.tester.test_results if test["verification"] is None and test["success"]), "test_results": []}
+    def serve_test_summary(self, query):
+        """Serve the test summary data, streaming the results in batches instead of building one document.
 
-        # Convert test results to serializable format
-        for test in self.tester.test_results:
-            serializable_test = {"function_name": test["function_name"], "inputs": test["inputs"], "success": test["success"], "verification": test["verification"], "timestamp": test["timestamp"]}
+        ?offset=N&limit=M selects a page of the results (all of them by default).
+        """
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query["limit"][0]) if "limit" in query else None
+        except ValueError:
+            offset = -1
+        if offset < 0 or (limit is not None and limit < 0):
+            self.send_error(400, "offset and limit must be non-negative integers")
+            return
 
-            # Convert output to serializable format
-            try:
-                json.dumps(test["output"])
-                serializable_test["output"] = test["output"]
-            except (TypeError, ValueError):
-                serializable_test["output"] = str(test["output"])
+        # Read before the snapshot, so the ETag can only be older than the data sent with it (never newer)
+        etag = f'"{_SUMMARY_ETAG_PREFIX}-{self.tester.results_version}-{offset}-{limit}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
 
-            summary_data["test_results"].append(serializable_test)
+        counts, test_results = self.tester.snapshot_test_results(offset, None if limit is None else offset + limit)
+        header = {**counts, "offset": offset, "has_more": offset + len(test_results) < counts["total_tests"]}
 
+        # The total length is unknown until the last batch is encoded, so each batch is sent as one chunk
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31) if self.accepts_gzip() else None  # wbits=31: gzip container
         self.send_response(200)
         self.send_header("Content-type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Vary", "Accept-Encoding")
+        if compressor is not None:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
         self.end_headers()
-        self.wfile.write(JEncoder().encode(summary_data).encode())
+
+        # {"total_tests": ..., <other counts>, "offset": ..., "has_more": ..., "test_results": [<record>, ...]}
+        self._write_chunk(_dumps_json(header)[:-1] + b',"test_results":[', compressor)
+        for start in range(0, len(test_results), _SUMMARY_BATCH_SIZE):
+            batch = b",".join(_dumps_json(self._summary_record(test), default=str) for test in test_results[start : start + _SUMMARY_BATCH_SIZE])
+            self._write_chunk(batch if start == 0 else b"," + batch, compressor)
+        self._write_chunk(b"]}", compressor)
+        if compressor is not None:
+            self._write_chunk(compressor.flush())
+        self.wfile.write(b"0\r\n\r\n")  # Last chunk
+
+    def _write_chunk(self, data, compressor=None):
+        """Write data as one chunk of a Transfer-Encoding: chunked body, through compressor if given."""
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:  # An empty chunk would end the body
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _summary_record(self, test):
+        """Convert a TestRecord to the summary's JSON shape."""
+        return {"function_name": test.function_name, "inputs": test.inputs, "success": test.success, "verification": test.verification, "timestamp": self.tester.format_timestamp(test.timestamp_ns), "output": test.output}
 
     def get_html_template(self):
         """Return the HTML template for the web interface."""
@@ -550,6 +791,16 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             margin-top: 10px;
         }
         
+        .result-value {
+            margin-top: 10px;
+        }
+        
+        .result-value pre {
+            margin: 5px 0 0;
+            white-space: pre-wrap;
+            word-break: break-word;
+        }
+        
         .verification-section {
             background: linear-gradient(135deg, #fff3e0 0%, #f3e5f5 100%);
             border-radius: 8px;
@@ -819,10 +1070,20 @@ class WebTestingHandler(BaseHTTPRequestHandler):
     <script>
         let selectedFunction = null;
         let functionInfo = null;
+        let paramElems = {};  // {param: input element} for the rendered form
+        let classElems = {};  // {param: {constructor param: input element}} for class-typed parameters
 
         // Load functions on page load
         document.addEventListener('DOMContentLoaded', function() {
             loadFunctions();
+            
+            // One delegated listener for the buttons of every rendered parameter form
+            document.getElementById('parameters-container').addEventListener('click', event => {
+                const target = event.target.closest('[data-action]');
+                if (target && target.dataset.action === 'toggle-class') {
+                    toggleClassInput(target.dataset.param, target);
+                }
+            });
         });
 
         async function loadFunctions() {
@@ -883,6 +1144,53 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             }
         }
 
+        // Markup for one parameter's input (a class parameter gets a field per constructor argument)
+        function buildParamHtml(param) {
+            const defaultValue = functionInfo.defaults[param];
+            const classInfo = functionInfo.class_info[param];
+            
+            if (classInfo) {
+                // Parameter expects a class instance
+                const suggestedText = classInfo.suggested ? ' (suggested)' : '';
+                return `
+                    <div class="parameter-input">
+                        <label class="parameter-label" for="param-${param}">
+                            ${param} - ${classInfo.class_name} instance${suggestedText}
+                        </label>
+                        <div class="class-input-container">
+                            <button type="button" class="button secondary" data-action="toggle-class" data-param="${param}">
+                                🏗️ Create ${classInfo.class_name}
+                            </button>
+                            <div id="class-inputs-${param}" class="class-inputs hidden">
+                                ${classInfo.parameters.map(classParam => {
+                                    const classDefault = classInfo.defaults[classParam];
+                                    return `
+                                        <div class="class-parameter">
+                                            <label class="class-parameter-label">${classParam}${classDefault !== undefined ? ` (default: ${classDefault})` : ''}</label>
+                                            <input type="text" id="class-${param}-${classParam}" class="parameter-field" 
+                                                   placeholder="Enter ${classParam}">
+                                        </div>
+                                    `;
+                                }).join('')}
+                            </div>
+                            <input type="hidden" id="param-${param}" class="parameter-field">
+                        </div>
+                    </div>
+                `;
+            }
+            
+            // Regular parameter
+            return `
+                <div class="parameter-input">
+                    <label class="parameter-label" for="param-${param}">
+                        ${param}${defaultValue !== undefined ? ` (default: ${defaultValue})` : ''}
+                    </label>
+                    <input type="text" id="param-${param}" class="parameter-field" 
+                           placeholder="Enter value for ${param}">
+                </div>
+            `;
+        }
+
         function displayFunctionDetails() {
             document.getElementById('no-selection').classList.add('hidden');
             document.getElementById('function-details').classList.remove('hidden');
@@ -900,82 +1208,80 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             document.getElementById('function-description').textContent = 
                 functionInfo.docstring || 'No description available';
             
+            // The whole form is one markup string, so the HTML parser runs once per function
             const container = document.getElementById('parameters-container');
-            container.innerHTML = '';
+            container.innerHTML = functionInfo.parameters.map(buildParamHtml).join('');
             
+            // Keep handles to the inputs so runs and generated values skip the id lookups
+            paramElems = {};
+            classElems = {};
             functionInfo.parameters.forEach(param => {
-                const defaultValue = functionInfo.defaults[param];
+                paramElems[param] = container.querySelector(`#${CSS.escape(`param-${param}`)}`);
                 const classInfo = functionInfo.class_info[param];
-                const inputDiv = document.createElement('div');
-                inputDiv.className = 'parameter-input';
-                
                 if (classInfo) {
-                    // Parameter expects a class instance
-                    const suggestedText = classInfo.suggested ? ' (suggested)' : '';
-                    inputDiv.innerHTML = `
-                        <label class="parameter-label" for="param-${param}">
-                            ${param} - ${classInfo.class_name} instance${suggestedText}
-                        </label>
-                        <div class="class-input-container">
-                            <button type="button" class="button secondary" onclick="toggleClassInput('${param}')">
-                                🏗️ Create ${classInfo.class_name}
-                            </button>
-                            <div id="class-inputs-${param}" class="class-inputs hidden">
-                                ${classInfo.parameters.map(classParam => {
-                                    const classDefault = classInfo.defaults[classParam];
-                                    return `
-                                        <div class="class-parameter">
-                                            <label class="class-parameter-label">${classParam}${classDefault !== undefined ? ` (default: ${classDefault})` : ''}</label>
-                                            <input type="text" id="class-${param}-${classParam}" class="parameter-field" 
-                                                   placeholder="Enter ${classParam}">
-                                        </div>
-                                    `;
-                                }).join('')}
-                            </div>
-                            <input type="hidden" id="param-${param}" class="parameter-field">
-                        </div>
-                    `;
-                } else {
-                    // Regular parameter
-                    inputDiv.innerHTML = `
-                        <label class="parameter-label" for="param-${param}">
-                            ${param}${defaultValue !== undefined ? ` (default: ${defaultValue})` : ''}
-                        </label>
-                        <input type="text" id="param-${param}" class="parameter-field" 
-                               placeholder="Enter value for ${param}">
-                    `;
+                    classElems[param] = {};
+                    classInfo.parameters.forEach(classParam => {
+                        classElems[param][classParam] = container.querySelector(`#${CSS.escape(`class-${param}-${classParam}`)}`);
+                    });
                 }
-                container.appendChild(inputDiv);
             });
             
             // Hide results section
             document.getElementById('results-section').classList.add('hidden');
         }
 
+        // Generated inputs are reused for GENERATED_INPUTS_TTL ms per function (generation may call the LLM),
+        // and a click while a request is in flight waits for that request instead of sending another
+        const GENERATED_INPUTS_TTL = 30000;
+        const generatedInputsCache = new Map();  // {function key: {time, inputs}}
+        const generateRequests = new Map();  // {function key: Promise of inputs}
+
+        function fillGeneratedInputs(inputs) {
+            Object.entries(inputs).forEach(([param, value]) => {
+                const input = paramElems[param];
+                if (input) {
+                    input.value = typeof value === 'string' ? value : JSON.stringify(value);
+                }
+            });
+        }
+
+        function requestGeneratedInputs(funcKey) {
+            if (!generateRequests.has(funcKey)) {
+                const request = (async () => {
+                    const response = await fetch('/api/generate-inputs', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({
+                            function_key: funcKey
+                        })
+                    });
+                    
+                    const inputs = await response.json();
+                    generatedInputsCache.set(funcKey, { time: Date.now(), inputs: inputs });
+                    return inputs;
+                })().finally(() => generateRequests.delete(funcKey));
+                generateRequests.set(funcKey, request);
+            }
+            return generateRequests.get(funcKey);
+        }
+
         async function generateInputs() {
             if (!selectedFunction) return;
             
+            const funcKey = selectedFunction;
+            const cached = generatedInputsCache.get(funcKey);
+            if (cached && Date.now() - cached.time < GENERATED_INPUTS_TTL) {
+                fillGeneratedInputs(cached.inputs);
+                return;
+            }
+            
             try {
-                const response = await fetch('/api/generate-inputs', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        function_key: selectedFunction
-                    })
-                });
-                
-                const inputs = await response.json();
-                
-                // Fill in the generated values
-                Object.entries(inputs).forEach(([param, value]) => {
-                    const input = document.getElementById(`param-${param}`);
-                    if (input) {
-                        input.value = typeof value === 'string' ? value : JSON.stringify(value);
-                    }
-                });
-                
+                const inputs = await requestGeneratedInputs(funcKey);
+                if (funcKey === selectedFunction) {  // The form may have switched to another function meanwhile
+                    fillGeneratedInputs(inputs);
+                }
             } catch (error) {
                 console.error('Error generating inputs:', error);
             }
@@ -995,18 +1301,13 @@ class WebTestingHandler(BaseHTTPRequestHandler):
                     inputs[param] = classInputs;
                 } else {
                     // Handle regular parameter
-                    const input = document.getElementById(`param-${param}`);
+                    const input = paramElems[param];
                     let value = input.value.trim();
                     
                     if (!value && functionInfo.defaults[param] !== undefined) {
                         value = functionInfo.defaults[param];
                     } else if (value) {
-                        // Try to parse as JSON, fallback to string
-                        try {
-                            value = JSON.parse(value);
-                        } catch {
-                            // Keep as string
-                        }
+                        value = parseCached(input, value);
                     } else {
                         value = null;
                     }
@@ -1016,21 +1317,11 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             });
             
             try {
-                const response = await fetch('/api/test-function', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        function_key: selectedFunction,
-                        inputs: inputs
-                    })
-                });
-                
-                const result = await response.json();
+                const result = await enqueueBatch('test', { function_key: selectedFunction, inputs: inputs });
                 displayResults(result);
                 
             } catch (error) {
+                if (error.name === 'AbortError') return;  // Superseded by a newer run
                 console.error('Error running test:', error);
                 displayResults({
                     success: false,
@@ -1040,6 +1331,79 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             }
         }
 
+        // Test runs and verifications queued in the same burst are sent to the server as one batch request per kind.
+        // A new test batch aborts the previous one's fetch - only the latest run's result is displayed.
+        const batchQueues = {
+            test: { url: '/api/test-functions-batch', field: 'tests', pending: [], abortPrevious: true, controller: null },
+            verify: { url: '/api/verify-results-batch', field: 'verifications', pending: [] }
+        };
+        const scheduleIdle = window.requestIdleCallback || (callback => setTimeout(callback, 0));
+
+        function enqueueBatch(kind, payload) {
+            const queue = batchQueues[kind];
+            return new Promise((resolve, reject) => {
+                if (queue.pending.length === 0) {
+                    scheduleIdle(() => flushBatch(queue));
+                }
+                queue.pending.push({ payload: payload, resolve: resolve, reject: reject });
+            });
+        }
+
+        async function flushBatch(queue) {
+            const batch = queue.pending;
+            queue.pending = [];
+            
+            let signal;
+            if (queue.abortPrevious) {
+                if (queue.controller) queue.controller.abort();
+                queue.controller = new AbortController();
+                signal = queue.controller.signal;
+            }
+            
+            try {
+                const response = await fetch(queue.url, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        [queue.field]: batch.map(item => item.payload)
+                    }),
+                    signal: signal
+                });
+                
+                const results = await response.json();
+                batch.forEach((item, i) => item.resolve(results[i]));
+                
+            } catch (error) {
+                batch.forEach(item => item.reject(error));
+            }
+        }
+
+        // Values whose compact JSON is longer than this show a preview; the full indented form is built on request
+        const PREVIEW_THRESHOLD = 16384;
+        const PREVIEW_LENGTH = 8192;
+
+        // [<pre>] with the value's indented JSON, or [<pre>, expand button] with a truncated preview for large values
+        function jsonPreview(value) {
+            const compact = JSON.stringify(value) ?? String(value);
+            if (compact.length <= PREVIEW_THRESHOLD) {
+                return [createElement('pre', null, JSON.stringify(value, null, 2) ?? compact)];
+            }
+            
+            const pre = createElement('pre', null, `${compact.slice(0, PREVIEW_LENGTH)}…`);
+            const expand = createElement('button', 'button secondary', `Show all (${compact.length.toLocaleString()} characters)`);
+            expand.type = 'button';
+            expand.onclick = () => {
+                expand.disabled = true;
+                scheduleIdle(() => {
+                    pre.textContent = JSON.stringify(value, null, 2);
+                    expand.remove();
+                });
+            };
+            return [pre, expand];
+        }
+
         function displayResults(result) {
             const resultsSection = document.getElementById('results-section');
             const container = document.getElementById('results-container');
@@ -1052,17 +1416,15 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             const resultClass = result.success ? 'result-success' : 'result-error';
             const icon = result.success ? '✅' : '❌';
             
-            container.innerHTML = `
-                <div class="${resultClass}">
-                    <strong>${icon} ${result.success ? 'Success' : 'Error'}</strong>
-                    <div style="margin-top: 10px;">
-                        <strong>Inputs:</strong> ${JSON.stringify(result.inputs_used, null, 2)}
-                    </div>
-                    <div style="margin-top: 10px;">
-                        <strong>Result:</strong> ${JSON.stringify(result.result, null, 2)}
-                    </div>
-                </div>
-            `;
+            // Built as nodes with textContent: the function's inputs and output are never parsed as HTML
+            const card = createElement('div', resultClass);
+            card.appendChild(createElement('strong', null, `${icon} ${result.success ? 'Success' : 'Error'}`));
+            [['Inputs:', result.inputs_used], ['Result:', result.result]].forEach(([label, value]) => {
+                const section = createElement('div', 'result-value');
+                section.append(createElement('strong', null, label), ...jsonPreview(value));
+                card.appendChild(section);
+            });
+            container.replaceChildren(card);
             
             // Show verification section only for successful results
             if (result.success) {
@@ -1078,17 +1440,30 @@ class WebTestingHandler(BaseHTTPRequestHandler):
 
         let lastTestResult = null;
 
-        function toggleClassInput(paramName) {
+        function toggleClassInput(paramName, button) {
             const classInputs = document.getElementById(`class-inputs-${paramName}`);
-            const button = event.target;
+            const className = functionInfo.class_info[paramName].class_name;
             
             if (classInputs.classList.contains('hidden')) {
                 classInputs.classList.remove('hidden');
-                button.textContent = `🔽 Hide ${button.textContent.split(' ')[1]}`;
+                button.textContent = `🔽 Hide ${className}`;
             } else {
                 classInputs.classList.add('hidden');
-                button.textContent = `🏗️ Create ${button.textContent.split(' ')[1]}`;
+                button.textContent = `🏗️ Create ${className}`;
+            }
+        }
+
+        // Parse a field's value as JSON, falling back to the raw string; the parse is reused until the text changes
+        function parseCached(input, raw) {
+            if (input._lastRaw !== raw) {
+                try {
+                    input._lastParsed = JSON.parse(raw);
+                } catch {
+                    input._lastParsed = raw;  // Keep as string
+                }
+                input._lastRaw = raw;
             }
+            return input._lastParsed;
         }
 
         function collectClassInputs(paramName, classInfo) {
@@ -1096,18 +1471,13 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             let hasValues = false;
             
             classInfo.parameters.forEach(classParam => {
-                const input = document.getElementById(`class-${paramName}-${classParam}`);
+                const input = classElems[paramName][classParam];
                 let value = input.value.trim();
                 
                 if (!value && classInfo.defaults[classParam] !== undefined) {
                     value = classInfo.defaults[classParam];
                 } else if (value) {
-                    // Try to parse as JSON, fallback to string
-                    try {
-                        value = JSON.parse(value);
-                    } catch {
-                        // Keep as string
-                    }
+                    value = parseCached(input, value);
                     hasValues = true;
                 } else {
                     value = null;
@@ -1160,20 +1530,12 @@ class WebTestingHandler(BaseHTTPRequestHandler):
 
         async function sendVerification(isCorrect) {
             try {
-                const response = await fetch('/api/verify-result', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        function_key: selectedFunction,
-                        is_correct: isCorrect,
-                        inputs: lastTestResult.inputs_used,
-                        result: lastTestResult.result
-                    })
+                const result = await enqueueBatch('verify', {
+                    function_key: selectedFunction,
+                    is_correct: isCorrect,
+                    inputs: lastTestResult.inputs_used,
+                    result: lastTestResult.result
                 });
-                
-                const result = await response.json();
                 console.log('Verification logged:', result);
                 
             } catch (error) {
@@ -1181,78 +1543,101 @@ class WebTestingHandler(BaseHTTPRequestHandler):
             }
         }
 
+        function createElement(tag, className, text) {
+            const element = document.createElement(tag);
+            if (className) element.className = className;
+            if (text !== undefined) element.textContent = text;
+            return element;
+        }
+
+        function labelledValue(label, value) {
+            const div = document.createElement('div');
+            div.append(createElement('strong', null, label), ` ${value}`);
+            return div;
+        }
+
+        // [item class, status class, status label] for a summary test record
+        function testStatus(test) {
+            if (!test.success) return ['error', 'error', 'ERROR'];
+            if (test.verification === 'PASSED') return ['passed', 'passed', 'PASSED'];
+            if (test.verification === 'FAILED') return ['failed', 'failed', 'FAILED'];
+            return ['success', 'unverified', 'UNVERIFIED'];
+        }
+
+        // The summary lists this many tests at first; "Load more" fetches the next page
+        const SUMMARY_PAGE_SIZE = 50;
+
+        async function fetchSummaryPage(offset) {
+            const response = await fetch(`/api/test-summary?offset=${offset}&limit=${SUMMARY_PAGE_SIZE}`);
+            return response.json();
+        }
+
+        function appendTestItems(testList, page) {
+            const items = document.createDocumentFragment();
+            page.test_results.forEach((test, index) => {
+                const [itemClass, statusClass, statusText] = testStatus(test);
+                const header = createElement('div', 'test-header');
+                header.append(
+                    createElement('span', 'test-name', `${page.offset + index + 1}. ${test.function_name}`),
+                    createElement('span', `test-status status-${statusClass}`, statusText)
+                );
+                const item = createElement('div', `test-item ${itemClass}`);
+                item.append(
+                    header,
+                    labelledValue('Input:', JSON.stringify(test.inputs)),
+                    labelledValue('Output:', JSON.stringify(test.output)),
+                    labelledValue('Time:', test.timestamp)
+                );
+                items.appendChild(item);
+            });
+            testList.appendChild(items);
+        }
+
         async function showTestSummary() {
             try {
-                const response = await fetch('/api/test-summary');
-                const summary = await response.json();
+                const summary = await fetchSummaryPage(0);
                 
                 const container = document.getElementById('summary-container');
                 
                 if (summary.total_tests === 0) {
                     container.innerHTML = '<p>No tests have been executed yet.</p>';
                 } else {
-                    container.innerHTML = `
-                        <div class="summary-stats">
-                            <div class="stat-card">
-                                <div class="stat-number">${summary.total_tests}</div>
-                                <div class="stat-label">Total Tests</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-number">${summary.successful_executions}</div>
-                                <div class="stat-label">Successful</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-number">${summary.verified_passed}</div>
-                                <div class="stat-label">Verified Passed</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-number">${summary.verified_failed}</div>
-                                <div class="stat-label">Verified Failed</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-number">${summary.unverified}</div>
-                                <div class="stat-label">Unverified</div>
-                            </div>
-                        </div>
-                        
-                        <h5>Test Details:</h5>
-                        <div class="test-list">
-                            ${summary.test_results.map((test, index) => {
-                                let statusClass = 'error';
-                                let statusText = 'ERROR';
-                                let itemClass = 'error';
-                                
-                                if (test.success) {
-                                    statusClass = 'success';
-                                    itemClass = 'success';
-                                    if (test.verification === 'PASSED') {
-                                        statusText = 'PASSED';
-                                        statusClass = 'passed';
-                                        itemClass = 'passed';
-                                    } else if (test.verification === 'FAILED') {
-                                        statusText = 'FAILED';
-                                        statusClass = 'failed';
-                                        itemClass = 'failed';
-                                    } else {
-                                        statusText = 'UNVERIFIED';
-                                        statusClass = 'unverified';
-                                    }
-                                }
-                                
-                                return `
-                                    <div class="test-item ${itemClass}">
-                                        <div class="test-header">
-                                            <span class="test-name">${index + 1}. ${test.function_name}</span>
-                                            <span class="test-status status-${statusClass}">${statusText}</span>
-                                        </div>
-                                        <div><strong>Input:</strong> ${JSON.stringify(test.inputs)}</div>
-                                        <div><strong>Output:</strong> ${JSON.stringify(test.output)}</div>
-                                        <div><strong>Time:</strong> ${test.timestamp}</div>
-                                    </div>
-                                `;
-                            }).join('')}
-                        </div>
-                    `;
+                    // Built as nodes with textContent: test inputs and outputs are never parsed as HTML
+                    const stats = createElement('div', 'summary-stats');
+                    [
+                        [summary.total_tests, 'Total Tests'],
+                        [summary.successful_executions, 'Successful'],
+                        [summary.verified_passed, 'Verified Passed'],
+                        [summary.verified_failed, 'Verified Failed'],
+                        [summary.unverified, 'Unverified']
+                    ].forEach(([count, label]) => {
+                        const card = createElement('div', 'stat-card');
+                        card.append(createElement('div', 'stat-number', count), createElement('div', 'stat-label', label));
+                        stats.appendChild(card);
+                    });
+                    
+                    const testList = createElement('div', 'test-list');
+                    appendTestItems(testList, summary);
+                    container.replaceChildren(stats, createElement('h5', null, 'Test Details:'), testList);
+                    
+                    if (summary.has_more) {
+                        let nextOffset = summary.test_results.length;
+                        const loadMore = createElement('button', 'button secondary', 'Load more');
+                        loadMore.onclick = async () => {
+                            loadMore.disabled = true;
+                            try {
+                                const page = await fetchSummaryPage(nextOffset);
+                                appendTestItems(testList, page);
+                                nextOffset += page.test_results.length;
+                                if (!page.has_more) loadMore.remove();
+                            } catch (error) {
+                                console.error('Error loading more tests:', error);
+                            } finally {
+                                loadMore.disabled = false;
+                            }
+                        };
+                        container.appendChild(loadMore);
+                    }
                 }
                 
                 container.classList.remove('hidden');
@@ -1273,21 +1658,25 @@ class WebTestingHandler(BaseHTTPRequestHandler):
         pass
 
 
-def create_handler_class(tester):
-    """Create a handler class with the tester instance."""
+def create_handler_class(tester, test_runner=None):
+    """Create a handler class with the tester instance (and optionally a TimedTestRunner that runs tests with a timeout)."""
+
+    info_cache = {}  # Shared by all requests - a handler instance only lives for one request
 
     def handler(*args, **kwargs):
-        WebTestingHandler(*args, tester=tester, **kwargs)
+        WebTestingHandler(*args, tester=tester, info_cache=info_cache, test_runner=test_runner, **kwargs)
 
     return handler
 
 
-def start_web_interface(tester, port=8080):
+def start_web_interface(tester, port=8080, test_timeout=30.0):
     """Start the web interface server."""
-    handler_class = create_handler_class(tester)
+    test_runner = TimedTestRunner(test_timeout)
+    handler_class = create_handler_class(tester, test_runner)
 
     try:
-        server = HTTPServer(("localhost", port), handler_class)
+        # One thread per request: a slow function under test does not block the page or other API calls
+        server = ThreadingHTTPServer(("localhost", port), handler_class)
         print(f"🌐 Web interface starting at http://localhost:{port}")
         print("Press Ctrl+C to stop the server")
 
@@ -1302,6 +1691,8 @@ def start_web_interface(tester, port=8080):
             print(f"❌ Port {port} is already in use. Try a different port with --port option")
         else:
             print(f"❌ Error starting server: {e}")
+    finally:
+        test_runner.shutdown()
 
 
 if __name__ == "__main__":
@@ -1312,6 +1703,8 @@ if __name__ == "__main__":
     parser.add_argument("--directory", "-d", default=".", help="Directory to search for Python files")
     parser.add_argument("--port", "-p", type=int, default=8080, help="Port for web server (default: 8080)")
     parser.add_argument("--api-key", "-k", help="OpenAI API key for intelligent input generation")
+    parser.add_argument("--cache-results", action="store_true", help="Reuse results of repeated calls with identical inputs (only for functions without side effects)")
+    parser.add_argument("--test-timeout", type=float, default=30.0, help="Seconds to wait for a tested function before reporting a timeout (default: 30)")
 
     args = parser.parse_args()
 
@@ -1319,7 +1712,7 @@ if __name__ == "__main__":
     api_key = args.api_key or os.environ.get("OPENAI_API_KEY")
 
     # Create tester instance and discover functions
-    tester = FunctionTester(args.directory, api_key)
+    tester = FunctionTester(args.directory, api_key, args.cache_results)
     print("🔍 Discovering functions and classes...")
     tester.discover_functions()
 
@@ -1332,4 +1725,4 @@ if __name__ == "__main__":
         print("Available classes:", ", ".join(tester.discovered_classes.keys()))
 
     # Start web interface
-    start_web_interface(tester, args.port)
+    start_web_interface(tester, args.port, args.test_timeout)